@@ -10,28 +10,14 @@ from .workflows import Workflow
 from .monitors import StrictMonitor
 from .strategies import RestartStrategy
 from .config import PurpleConfig
+from .pool import PagePool
+from .banner import PURPLE_BANNER, print_banner
 
 __all__ = [
     "PurpleGuardian",
     "Workflow",
     "StrictMonitor",
     "RestartStrategy",
-    "PurpleConfig"
+    "PurpleConfig",
+    "PagePool"
 ]
-
-# 💜 ASCII Art for fun
-PURPLE_BANNER = """
-╔═══════════════════════════════════════╗
-║     💜 PURPLE GUARDIAN ACTIVE 💜      ║
-║     Zero Tolerance · Pure Execution   ║
-╚═══════════════════════════════════════╝
-"""
-
-def print_banner():
-    from rich.console import Console
-    from rich.text import Text
-
-    console = Console()
-    text = Text(PURPLE_BANNER)
-    text.stylize("bold magenta")
-    console.print(text)
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+💜 Startup banner for Purple Guardian
+"""
+
+from functools import lru_cache
+
+
+# 💜 ASCII Art for fun
+PURPLE_BANNER = """
+╔═══════════════════════════════════════╗
+║     💜 PURPLE GUARDIAN ACTIVE 💜      ║
+║     Zero Tolerance · Pure Execution   ║
+╚═══════════════════════════════════════╝
+"""
+
+_BANNER_PRINTED = False
+
+
+@lru_cache(maxsize=None)
+def _banner_text():
+    """Build the styled banner once; rich is only imported when needed"""
+    from rich.text import Text
+
+    text = Text(PURPLE_BANNER)
+    text.stylize("bold magenta")
+    return text
+
+
+def print_banner():
+    """Print the purple banner, at most once per process"""
+    global _BANNER_PRINTED
+    if _BANNER_PRINTED:
+        return
+    _BANNER_PRINTED = True
+
+    from rich.console import Console
+
+    console = Console()
+    console.print(_banner_text())
@@ -2,27 +2,119 @@
 💜 Configuration management for Purple Guardian
 """
 
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+import json
 import os
+import sys
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use only"""
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required for YAML config files")
+    return yaml
+
+
+def _load_yaml(stream):
+    return _yaml().safe_load(stream)
+
+
+def _dump_json(data, stream):
+    json.dump(data, stream, indent=2)
+
+
+def _dump_yaml(data, stream):
+    _yaml().dump(data, stream, default_flow_style=False, indent=2)
+
+
+_DEFAULT_BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions"
+)
+
+def _check_max_retries(value):
+    if value < 0:
+        raise ValueError("max_retries must be >= 0")
+
+
+def _check_retry_delay(value):
+    if value < 0:
+        raise ValueError("retry_delay must be >= 0")
+
+
+def _check_timeout(value):
+    if value < 1000:
+        raise ValueError("default_timeout must be >= 1000ms")
+
+
+def _check_viewport(value):
+    if not isinstance(value, dict) or "width" not in value or "height" not in value:
+        raise ValueError("viewport must be a dict with 'width' and 'height' keys")
+    
+    if value["width"] < 100 or value["height"] < 100:
+        raise ValueError("viewport dimensions must be >= 100px")
+
+
+def _ensure_directory(path: str):
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+# Field -> validator, so update() only checks what actually changed
+_VALIDATORS = {
+    "max_retries": _check_max_retries,
+    "retry_delay": _check_retry_delay,
+    "default_timeout": _check_timeout,
+    "viewport": _check_viewport
+}
+
+# Directory field -> flag that enables it
+_DIR_FIELDS = {
+    "screenshot_path": "screenshot_on_violation",
+    "page_source_path": "save_page_source_on_violation"
+}
+
+# Fields that feed the compiled Playwright options
+_OPTION_FIELDS = frozenset({"headless", "browser_args", "user_agent", "viewport", "default_timeout"})
+
+DEFAULT_LOG_FORMAT = "💜 %(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# Slotted instances are smaller and faster to read; needs Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_LOADERS = {".json": json.load, ".yml": _load_yaml, ".yaml": _load_yaml}
+_DUMPERS = {".json": _dump_json, ".yml": _dump_yaml, ".yaml": _dump_yaml}
+
+
+def _config_format(config_path: str, handlers: Dict[str, Any]):
+    """Pick the (de)serializer for a config path by its extension"""
+    handler = handlers.get(os.path.splitext(config_path)[1].lower())
+    if handler is None:
+        raise ValueError("Config file must be JSON or YAML")
+    return handler
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PurpleConfig:
     """
     💜 Purple Guardian configuration class
     
     Centralized configuration management for all Purple Guardian settings.
+    Playwright option mappings are built once per change; assign fields
+    through update() so they stay in sync.
     """
     
     # Browser settings
     headless: bool = True
-    browser_args: list = field(default_factory=lambda: [
-        "--no-sandbox",
-        "--disable-dev-shm-usage",
-        "--disable-blink-features=AutomationControlled",
-        "--disable-extensions"
-    ])
+    browser_args: Tuple[str, ...] = _DEFAULT_BROWSER_ARGS
     user_agent: Optional[str] = None
     viewport: Dict[str, int] = field(default_factory=lambda: {"width": 1920, "height": 1080})
     
@@ -50,7 +142,7 @@ class PurpleConfig:
     
     # Logging settings
     log_level: str = "INFO"
-    log_format: str = "💜 %(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    log_format: str = DEFAULT_LOG_FORMAT
     enable_rich_logging: bool = True
     
     # Screenshots and debugging
@@ -66,94 +158,112 @@ class PurpleConfig:
     
     # Custom settings
     custom_settings: Dict[str, Any] = field(default_factory=dict)
+    
+    # Compiled Playwright options (derived, rebuilt by _compile_options)
+    _launch_options: Optional[Mapping[str, Any]] = field(init=False, repr=False, compare=False, default=None)
+    _context_options: Optional[Mapping[str, Any]] = field(init=False, repr=False, compare=False, default=None)
+    _page_options: Optional[Mapping[str, Any]] = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
         """Post-initialization validation and setup"""
+        self.browser_args = tuple(self.browser_args)
         self._validate_config()
         self._setup_directories()
+        self._compile_options()
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        # Assigning an option field directly drops the compiled mappings;
+        # the getters rebuild them on next use
+        if name in _OPTION_FIELDS:
+            object.__setattr__(self, "_launch_options", None)
 
     def _validate_config(self):
         """Validate configuration values"""
-        if self.max_retries < 0:
-            raise ValueError("max_retries must be >= 0")
-        
-        if self.retry_delay < 0:
-            raise ValueError("retry_delay must be >= 0")
-        
-        if self.default_timeout < 1000:
-            raise ValueError("default_timeout must be >= 1000ms")
-        
-        if not isinstance(self.viewport, dict) or "width" not in self.viewport or "height" not in self.viewport:
-            raise ValueError("viewport must be a dict with 'width' and 'height' keys")
-        
-        if self.viewport["width"] < 100 or self.viewport["height"] < 100:
-            raise ValueError("viewport dimensions must be >= 100px")
+        for name, check in _VALIDATORS.items():
+            check(getattr(self, name))
 
     def _setup_directories(self):
         """Setup required directories"""
-        if self.screenshot_on_violation:
-            os.makedirs(self.screenshot_path, exist_ok=True)
+        for path_field, flag in _DIR_FIELDS.items():
+            if getattr(self, flag):
+                _ensure_directory(getattr(self, path_field))
+
+    def _compile_options(self):
+        """Build read-only Playwright option mappings once per config change"""
+        self._launch_options = MappingProxyType({
+            "headless": self.headless,
+            "args": tuple(self.browser_args)
+        })
         
-        if self.save_page_source_on_violation:
-            os.makedirs(self.page_source_path, exist_ok=True)
+        context_options = {"viewport": dict(self.viewport)}
+        if self.user_agent:
+            context_options["user_agent"] = self.user_agent
+        self._context_options = MappingProxyType(context_options)
+        
+        self._page_options = MappingProxyType({
+            "default_timeout": self.default_timeout
+        })
 
     @classmethod
     def from_env(cls) -> "PurpleConfig":
         """Create configuration from environment variables"""
-        config = cls()
+        env = os.environ
+        kwargs: Dict[str, Any] = {}
         
         # Browser settings
-        if os.getenv("PURPLE_HEADLESS"):
-            config.headless = os.getenv("PURPLE_HEADLESS").lower() == "true"
+        value = env.get("PURPLE_HEADLESS")
+        if value:
+            kwargs["headless"] = value.lower() == "true"
         
-        if os.getenv("PURPLE_USER_AGENT"):
-            config.user_agent = os.getenv("PURPLE_USER_AGENT")
+        value = env.get("PURPLE_USER_AGENT")
+        if value:
+            kwargs["user_agent"] = value
         
         # Timeout settings
-        if os.getenv("PURPLE_DEFAULT_TIMEOUT"):
-            config.default_timeout = int(os.getenv("PURPLE_DEFAULT_TIMEOUT"))
+        value = env.get("PURPLE_DEFAULT_TIMEOUT")
+        if value:
+            kwargs["default_timeout"] = int(value)
         
-        if os.getenv("PURPLE_PAGE_LOAD_TIMEOUT"):
-            config.page_load_timeout = int(os.getenv("PURPLE_PAGE_LOAD_TIMEOUT"))
+        value = env.get("PURPLE_PAGE_LOAD_TIMEOUT")
+        if value:
+            kwargs["page_load_timeout"] = int(value)
         
         # Retry settings
-        if os.getenv("PURPLE_MAX_RETRIES"):
-            config.max_retries = int(os.getenv("PURPLE_MAX_RETRIES"))
+        value = env.get("PURPLE_MAX_RETRIES")
+        if value:
+            kwargs["max_retries"] = int(value)
         
-        if os.getenv("PURPLE_RETRY_DELAY"):
-            config.retry_delay = float(os.getenv("PURPLE_RETRY_DELAY"))
+        value = env.get("PURPLE_RETRY_DELAY")
+        if value:
+            kwargs["retry_delay"] = float(value)
         
         # Monitoring settings
-        if os.getenv("PURPLE_STRICT_MONITORING"):
-            config.enable_strict_monitoring = os.getenv("PURPLE_STRICT_MONITORING").lower() == "true"
+        value = env.get("PURPLE_STRICT_MONITORING")
+        if value:
+            kwargs["enable_strict_monitoring"] = value.lower() == "true"
         
         # Logging settings
-        if os.getenv("PURPLE_LOG_LEVEL"):
-            config.log_level = os.getenv("PURPLE_LOG_LEVEL")
+        value = env.get("PURPLE_LOG_LEVEL")
+        if value:
+            kwargs["log_level"] = value
         
         # Screenshot settings
-        if os.getenv("PURPLE_SCREENSHOT_PATH"):
-            config.screenshot_path = os.getenv("PURPLE_SCREENSHOT_PATH")
+        value = env.get("PURPLE_SCREENSHOT_PATH")
+        if value:
+            kwargs["screenshot_path"] = value
         
-        return config
+        # Validated and directories created exactly once
+        return cls(**kwargs)
 
     @classmethod
     def from_file(cls, config_path: str) -> "PurpleConfig":
         """Create configuration from JSON/YAML file"""
-        import json
+        loader = _config_format(config_path, _LOADERS)
         
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                if config_path.endswith('.json'):
-                    data = json.load(f)
-                elif config_path.endswith(('.yml', '.yaml')):
-                    try:
-                        import yaml
-                        data = yaml.safe_load(f)
-                    except ImportError:
-                        raise ImportError("PyYAML is required to load YAML config files")
-                else:
-                    raise ValueError("Config file must be JSON or YAML")
+                data = loader(f)
             
             return cls(**data)
             
@@ -164,89 +274,69 @@ class PurpleConfig:
 
     def save_to_file(self, config_path: str):
         """Save configuration to JSON/YAML file"""
-        import json
-        from dataclasses import asdict
-        
-        data = asdict(self)
+        dumper = _config_format(config_path, _DUMPERS)
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
+        data["browser_args"] = list(self.browser_args)  # YAML has no plain tuple
         
         try:
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
+            os.makedirs(os.path.dirname(config_path) or ".", exist_ok=True)
             
             with open(config_path, 'w', encoding='utf-8') as f:
-                if config_path.endswith('.json'):
-                    json.dump(data, f, indent=2)
-                elif config_path.endswith(('.yml', '.yaml')):
-                    try:
-                        import yaml
-                        yaml.dump(data, f, default_flow_style=False, indent=2)
-                    except ImportError:
-                        raise ImportError("PyYAML is required to save YAML config files")
-                else:
-                    raise ValueError("Config file must be JSON or YAML")
+                dumper(data, f)
                     
         except Exception as e:
             raise ValueError(f"Error saving config file: {e}")
 
     def update(self, **kwargs):
         """Update configuration values"""
+        changed = set()
         for key, value in kwargs.items():
+            if key == "browser_args":
+                value = tuple(value)
+            
             if hasattr(self, key):
+                # Validate only the fields being changed
+                check = _VALIDATORS.get(key)
+                if check:
+                    check(value)
                 setattr(self, key, value)
+                changed.add(key)
             else:
                 self.custom_settings[key] = value
         
-        # Re-validate after updates
-        self._validate_config()
-        self._setup_directories()
-
-    def get_browser_launch_options(self) -> Dict[str, Any]:
-        """Get browser launch options for Playwright"""
-        options = {
-            "headless": self.headless,
-            "args": self.browser_args.copy()
-        }
+        for path_field, flag in _DIR_FIELDS.items():
+            if (path_field in changed or flag in changed) and getattr(self, flag):
+                _ensure_directory(getattr(self, path_field))
         
-        if self.user_agent:
-            options["user_agent"] = self.user_agent
-        
-        return options
+    def get_browser_launch_options(self) -> Mapping[str, Any]:
+        """Get browser launch options for Playwright"""
+        if self._launch_options is None:
+            self._compile_options()
+        return self._launch_options
 
-    def get_browser_context_options(self) -> Dict[str, Any]:
+    def get_browser_context_options(self) -> Mapping[str, Any]:
         """Get browser context options for Playwright"""
-        options = {
-            "viewport": self.viewport.copy()
-        }
-        
-        if self.user_agent:
-            options["user_agent"] = self.user_agent
-        
-        return options
+        if self._launch_options is None:
+            self._compile_options()
+        return self._context_options
 
-    def get_page_options(self) -> Dict[str, Any]:
+    def get_page_options(self) -> Mapping[str, Any]:
         """Get page options for Playwright"""
-        return {
-            "default_timeout": self.default_timeout
-        }
+        if self._launch_options is None:
+            self._compile_options()
+        return self._page_options
 
     def copy(self) -> "PurpleConfig":
         """Create a copy of the configuration"""
-        from dataclasses import replace
-        return replace(self)
+        return PurpleConfig(**{name: getattr(self, name) for name in _FIELD_NAMES})
 
     def merge(self, other: "PurpleConfig") -> "PurpleConfig":
         """Merge with another configuration"""
-        from dataclasses import asdict, replace
-        
-        # Get current config as dict
-        current_data = asdict(self)
-        other_data = asdict(other)
-        
-        # Merge dictionaries
-        merged_data = {**current_data, **other_data}
+        # Other config wins field by field, without deep-copying either side
+        merged_data = {name: getattr(other, name) for name in _FIELD_NAMES}
         
         # Merge custom settings separately
-        merged_custom = {**current_data.get("custom_settings", {}), **other_data.get("custom_settings", {})}
-        merged_data["custom_settings"] = merged_custom
+        merged_data["custom_settings"] = {**self.custom_settings, **other.custom_settings}
         
         return PurpleConfig(**merged_data)
 
@@ -258,6 +348,10 @@ class PurpleConfig:
                 f"default_timeout={self.default_timeout})")
 
 
+# User-settable fields, in declaration order
+_FIELD_NAMES = tuple(f.name for f in fields(PurpleConfig) if f.init)
+
+
 # Predefined configurations
 class PresetConfigs:
     """💜 Predefined configuration presets"""
@@ -299,14 +393,10 @@ class PresetConfigs:
             enable_rich_logging=False,
             default_timeout=20000,
             max_retries=2,
-            browser_args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-extensions",
+            browser_args=_DEFAULT_BROWSER_ARGS + (
                 "--disable-gpu",
                 "--single-process"
-            ]
+            )
         )
     
     @staticmethod
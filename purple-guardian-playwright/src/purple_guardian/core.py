@@ -1,17 +1,61 @@
 """
 💜 Core Purple Guardian implementation
+
+Importing this module turns off process, thread and multiprocessing
+metadata on log records (logging.logProcesses/logThreads/
+logMultiprocessing) for the whole interpreter; none of it is used by
+the Purple Guardian log format.
 """
 
 import asyncio
 import logging
 from typing import Optional, Dict, Any, List
-from playwright.async_api import Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
 from .workflows import Workflow
 from .monitors import StrictMonitor
 from .strategies import RestartStrategy
-from .config import PurpleConfig
+from .config import PurpleConfig, DEFAULT_LOG_FORMAT
 from .detectors import ViolationDetector
+from .banner import print_banner
+
+
+# Skip per-record os.getpid()/thread/multiprocessing lookups
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+
+_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT, style="%", validate=False)
+
+# One logger and handler per distinct log format, so guardians with
+# different formats never overwrite each other's formatter
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def _guardian_logger(log_format: str) -> logging.Logger:
+    """Get the logger for a log format, creating it and its handler once"""
+    logger = _LOGGERS.get(log_format)
+    if logger is None:
+        if log_format == DEFAULT_LOG_FORMAT:
+            logger, formatter = logging.getLogger("PurpleGuardian"), _FORMATTER
+        else:
+            logger = logging.getLogger(f"PurpleGuardian.format{len(_LOGGERS)}")
+            formatter = logging.Formatter(log_format)
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.propagate = False
+        _LOGGERS[log_format] = logger
+    return logger
+
+
+class _Stats:
+    """Execution counters, kept as plain slots for cheap increments"""
+
+    __slots__ = ("total", "ok", "restarts", "violations")
+
+    def __init__(self):
+        self.total = self.ok = self.restarts = self.violations = 0
 
 
 class PurpleGuardian:
@@ -34,165 +78,295 @@ class PurpleGuardian:
         self.restart_strategy = restart_strategy or RestartStrategy()
         self.monitor = monitor or StrictMonitor()
         self.violation_detector = ViolationDetector()
+        # Set while an attempt uses the monitor and detector above
+        self._watchers_busy = False
         
-        self.logger = logging.getLogger("PurpleGuardian")
         self._setup_logging()
         
         # Execution state
+        self._playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
+        self._ctx_pool: Optional[asyncio.Queue] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
         self.current_workflow: Optional[Workflow] = None
+        # Entered with `async with`; otherwise the browser closes after each run
+        self._entered = False
+        self._active_runs = 0
         
         # Statistics
-        self.stats = {
-            "total_executions": 0,
-            "successful_executions": 0,
-            "restart_count": 0,
-            "violations_detected": 0
-        }
+        self._stats = _Stats()
 
     def _setup_logging(self):
         """Setup logging with purple style"""
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "💜 %(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        )
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        # Guardians with the same format share a logger and its handler
+        self.logger = _guardian_logger(self.config.log_format)
+        self.logger.setLevel(self.config.log_level)
 
     async def run(self, workflow: Workflow) -> Dict[str, Any]:
         """
         Execute workflow with Purple Guardian protection
         
+        Outside `async with`, the browser is launched for the run and shut
+        down once no run is in flight; use `async with` to keep it between runs.
+        
         Args:
             workflow: The workflow to execute
             
         Returns:
             Dict containing execution results and statistics
         """
+        # Without `async with` the browser only lives while runs are in flight
+        self._active_runs += 1
+        try:
+            return await self._run(workflow)
+        finally:
+            self._active_runs -= 1
+            if not self._entered and self._active_runs == 0:
+                await self.close()
+
+    async def _run(self, workflow: Workflow) -> Dict[str, Any]:
+        """Run the workflow, retrying failed attempts on fresh contexts"""
         self.current_workflow = workflow
-        self.stats["total_executions"] += 1
+        self._stats.total += 1
         
-        self.logger.info(f"💜 Starting Purple Guardian execution for {workflow.__class__.__name__}")
+        self.logger.info("💜 Starting Purple Guardian execution for %s", workflow.__class__.__name__)
         
-        from . import print_banner
-        print_banner()
+        if self.config.enable_rich_logging:
+            print_banner()
         
         for attempt in range(self.max_retries + 1):
+            context: Optional[BrowserContext] = None
             try:
-                result = await self._execute_attempt(workflow, attempt)
-                self.stats["successful_executions"] += 1
-                self.logger.info("💜 Workflow completed successfully!")
-                return result
+                # A crashed browser is relaunched here, so this is retried too
+                context = await self._acquire_context()
+                result = await self._execute_attempt(workflow, attempt, context)
                 
             except Exception as e:
-                self.stats["violations_detected"] += 1
-                self.logger.warning(f"💜 Violation detected on attempt {attempt + 1}: {e}")
+                # The dirty context's slot is freed before anything else can
+                # fail; a fresh context is made when it is next borrowed
+                if context is not None:
+                    self._release_context(None)
+                self._stats.violations += 1
+                self.logger.warning("💜 Violation detected on attempt %d: %s", attempt + 1, e)
                 
                 if attempt < self.max_retries:
-                    self.stats["restart_count"] += 1
-                    await self._handle_restart(attempt)
+                    self._stats.restarts += 1
+                    await self._handle_restart(attempt, context)
                 else:
+                    await self._close_context(context)
                     self.logger.error("💜 Max retries exceeded. Workflow failed.")
                     raise
+            
+            except BaseException:
+                # Cancelled (e.g. by a timeout): the context is discarded too
+                if context is not None:
+                    self._release_context(None)
+                    await self._close_context(context)
+                raise
+            
+            else:
+                self._release_context(context)
+                self._stats.ok += 1
+                self.logger.info("💜 Workflow completed successfully!")
+                return result
         
-        return {"status": "failed", "stats": self.stats}
+        return {"status": "failed", "stats": self.get_stats()}
 
-    async def _execute_attempt(self, workflow: Workflow, attempt: int) -> Dict[str, Any]:
-        """Execute a single workflow attempt"""
-        self.logger.info(f"💜 Attempt {attempt + 1}/{self.max_retries + 1}")
+    async def _execute_attempt(
+        self,
+        workflow: Workflow,
+        attempt: int,
+        context: BrowserContext
+    ) -> Dict[str, Any]:
+        """Execute a single workflow attempt on a borrowed browser context"""
+        self.logger.info("💜 Attempt %d/%d", attempt + 1, self.max_retries + 1)
+        
+        page: Optional[Page] = None
+        reuse_page = False
+        
+        # The guardian's own monitor and detector serve one attempt at a
+        # time; attempts running alongside it get copies with the same rules
+        shared = not self._watchers_busy
+        if shared:
+            self._watchers_busy = True
+            monitor, detector = self.monitor, self.violation_detector
+        else:
+            monitor, detector = self.monitor.clone(), self.violation_detector.clone()
         
         try:
-            # Initialize browser environment
-            await self._setup_browser()
+            # Pages are reused across runs on the same context
+            page = await workflow.acquire_page(context)
+            page.set_default_timeout(self.config.default_timeout)
             
             # Setup monitoring
-            await self.monitor.setup(self.page)
-            await self.violation_detector.setup(self.page)
+            await monitor.setup(page)
+            await detector.setup(page)
             
             # Execute workflow with monitoring
-            result = await workflow.execute(self.page)
+            result = await workflow.execute(page)
             
             # Validate final state
-            await self._validate_final_state()
+            await self._validate_final_state(monitor, detector)
+            reuse_page = True
             
             return {
                 "status": "success",
                 "result": result,
                 "attempt": attempt + 1,
-                "stats": self.stats
+                "stats": self.get_stats()
             }
             
         finally:
-            await self._cleanup_browser()
+            # Handlers must not outlive the attempt on a page that is reused
+            monitor.stop()
+            if shared:
+                self._watchers_busy = False
+            # A page that failed is closed; its context is replaced anyway
+            if page:
+                await workflow.release_page(page, reuse=reuse_page)
 
     async def _setup_browser(self):
-        """Setup fresh browser environment"""
-        from playwright.async_api import async_playwright
+        """Launch the shared browser and fill the context pool if not running yet"""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
         
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=self.config.headless,
-            args=self.config.browser_args
-        )
+        async with self._browser_lock:
+            if self.browser:
+                if not self.browser.is_connected():
+                    await self._relaunch_browser()
+                return
+            
+            self._playwright = await async_playwright().start()
+            self.browser = await self._playwright.chromium.launch(
+                **self.config.get_browser_launch_options()
+            )
+            
+            pool_size = max(1, self.config.concurrent_limit)
+            self._ctx_pool = asyncio.Queue(maxsize=pool_size)
+            contexts = await asyncio.gather(
+                *(self._new_context() for _ in range(pool_size)),
+                return_exceptions=True
+            )
+            # A context that failed to open is retried when its slot is borrowed
+            for context in contexts:
+                self._ctx_pool.put_nowait(None if isinstance(context, BaseException) else context)
+
+    async def _relaunch_browser(self):
+        """Replace a crashed or closed browser; pooled contexts are replaced as they are borrowed"""
+        self.logger.warning("💜 Browser disconnected, relaunching...")
+        try:
+            await self.browser.close()
+        except Exception as e:
+            self.logger.debug("💜 Failed to close disconnected browser: %s", e)
         
-        self.context = await self.browser.new_context(
-            viewport=self.config.viewport,
-            user_agent=self.config.user_agent
+        # If the launch fails the old browser stays, so the next attempt retries it
+        self.browser = await self._playwright.chromium.launch(
+            **self.config.get_browser_launch_options()
         )
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a fresh browser context on the shared browser"""
+        return await self.browser.new_context(
+            **self.config.get_browser_context_options()
+        )
+
+    async def _acquire_context(self) -> BrowserContext:
+        """Borrow a browser context, waiting while all are in use"""
+        await self._setup_browser()
+        context = await self._ctx_pool.get()
+        if context is not None and context.browser is self.browser:
+            return context
         
-        self.page = await self.context.new_page()
-        
-        # Set timeouts
-        self.page.set_default_timeout(self.config.default_timeout)
+        try:
+            # The slot's previous context was discarded or died with its browser
+            await self._close_context(context)
+            return await self._new_context()
+        except BaseException:
+            self._release_context(None)
+            raise
 
-    async def _cleanup_browser(self):
-        """Cleanup browser resources"""
-        if self.page:
-            await self.page.close()
-            self.page = None
-            
-        if self.context:
-            await self.context.close()
-            self.context = None
-            
+    def _release_context(self, context: Optional[BrowserContext]):
+        """Return a borrowed browser context (None for a discarded one) to the pool"""
+        self._ctx_pool.put_nowait(context)
+
+    async def _close_context(self, context: Optional[BrowserContext]):
+        """Close a discarded context; its slot has already been returned"""
+        if context is None:
+            return
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.debug("💜 Failed to close discarded context: %s", e)
+
+    async def _close_browser(self):
+        """Close pooled contexts, the shared browser and Playwright"""
+        if self._ctx_pool is not None:
+            while not self._ctx_pool.empty():
+                context = self._ctx_pool.get_nowait()
+                if context is not None:
+                    await context.close()
+            self._ctx_pool = None
+        
         if self.browser:
             await self.browser.close()
             self.browser = None
+        
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
-    async def _handle_restart(self, attempt: int):
+    async def _handle_restart(self, attempt: int, context: BrowserContext):
         """Handle restart with strategy"""
         self.logger.info("💜 Initiating clean restart...")
         
-        # Cleanup current state
-        await self._cleanup_browser()
-        
         # Apply restart strategy delay
         delay = self.restart_strategy.get_delay(attempt)
         if delay > 0:
-            self.logger.info(f"💜 Waiting {delay}s before restart...")
-            await asyncio.sleep(delay)
+            self.logger.info("💜 Waiting %ss before restart...", delay)
+        
+        # A fresh context (cookies, storage, JS state) is a clean slate and
+        # the browser itself stays up; close the old one while the backoff runs
+        await asyncio.gather(self._close_context(context), asyncio.sleep(delay))
 
-    async def _validate_final_state(self):
+    async def _validate_final_state(self, monitor: StrictMonitor, detector: ViolationDetector):
         """Validate final execution state"""
-        if self.monitor.has_violations():
-            violations = self.monitor.get_violations()
-            raise Exception(f"Final state violations: {violations}")
+        monitor_violations, detector_violations = await asyncio.gather(
+            monitor.get_violations_async(),
+            detector.get_violations_async()
+        )
         
-        if self.violation_detector.has_violations():
-            violations = self.violation_detector.get_violations()
-            raise Exception(f"Unexpected elements detected: {violations}")
+        # Report everything at once instead of stopping at the first source
+        problems = []
+        if monitor_violations:
+            problems.append(f"Final state violations: {list(monitor_violations)}")
+        if detector_violations:
+            problems.append(f"Unexpected elements detected: {list(detector_violations)}")
+        
+        if problems:
+            raise Exception("; ".join(problems))
 
     def get_stats(self) -> Dict[str, Any]:
         """Get execution statistics"""
-        return self.stats.copy()
+        stats = self._stats
+        return {
+            "total_executions": stats.total,
+            "successful_executions": stats.ok,
+            "restart_count": stats.restarts,
+            "violations_detected": stats.violations
+        }
+
+    async def close(self):
+        """Stop monitoring and shut down the shared browser and Playwright driver"""
+        self.monitor.stop()
+        await self._close_browser()
 
     async def __aenter__(self):
         """Async context manager entry"""
+        self._entered = True
+        await self._setup_browser()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self._cleanup_browser()
\ No newline at end of file
+        self._entered = False
+        await self.close()
\ No newline at end of file
@@ -4,77 +4,250 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Set, Optional, Callable
+import re
+import time
+import weakref
+from collections import Counter, deque
+from typing import List, Dict, Any, Set, Optional, Callable, Tuple, Deque
 from playwright.async_api import Page
 
 
+# Collect every element matching any selector in one round-trip. One
+# composite selector walks the tree once and hits are attributed to their
+# rules with matches(); if any selector is invalid, fall back to one query
+# per selector and skip the invalid ones like before
+_UNEXPECTED_ELEMENTS_JS = """
+(selectors) => {
+    const describe = (selector, el) => ({
+        selector: selector,
+        tag_name: el.tagName.toLowerCase(),
+        text: (el.textContent || "").slice(0, 200)
+    });
+    let hits;
+    try {
+        hits = document.querySelectorAll(selectors.join(","));
+    } catch (e) {
+        return selectors.flatMap((selector) => {
+            let elements;
+            try {
+                elements = document.querySelectorAll(selector);
+            } catch (e) {
+                return [];
+            }
+            return Array.from(elements, (el) => describe(selector, el));
+        });
+    }
+    return Array.from(hits).flatMap((el) =>
+        selectors.filter((selector) => el.matches(selector)).map((selector) => describe(selector, el))
+    );
+}
+"""
+
+# Return the selectors that match nothing
+_MISSING_ELEMENTS_JS = """
+(selectors) => selectors.filter((selector) => {
+    try {
+        return !document.querySelector(selector);
+    } catch (e) {
+        return false;
+    }
+})
+"""
+# One regex pass rejects clean pages; only on a hit are needles attributed.
+# Returns the indexes of the (lowercased) needles present in the body text.
+_PROHIBITED_TEXTS_JS = """
+([source, needles]) => {
+    const text = ((document.body && document.body.textContent) || "").toLowerCase();
+    if (!new RegExp(source).test(text)) {
+        return [];
+    }
+    return needles.flatMap((needle, index) => text.includes(needle) ? [index] : []);
+}
+"""
+
+_JS_REGEX_SPECIAL = re.compile(r"[.*+?^${}()|[\]\\/]")
+
+
+def _js_regex_escape(text: str) -> str:
+    """Escape text for use as a literal inside a JavaScript RegExp"""
+    return _JS_REGEX_SPECIAL.sub(r"\\\g<0>", text)
+
+# Counts DOM mutations so unchanged pages can be recognised cheaply. The
+# count restarts with every document, so each one also gets its own token
+_MUTATION_SEQ_JS = """
+(() => {
+    window.__pgDoc = performance.timeOrigin + ":" + Math.random().toString(36).slice(2);
+    window.__pgSeq = 0;
+    new MutationObserver(() => { window.__pgSeq += 1; }).observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true
+    });
+})();
+"""
+
+# [mutation sequence (null when not instrumented), document token, url, readyState]
+_SCAN_PROBE_JS = """
+() => [
+    typeof window.__pgSeq === "number" ? window.__pgSeq : null,
+    window.__pgDoc || null,
+    location.href,
+    document.readyState
+]
+"""
+
+# Ready state, broken image count, mutation sequence and document token in
+# one round-trip
+_PAGE_STATE_JS = """
+() => ({
+    ready: document.readyState,
+    broken: Array.from(document.images).filter((img) => !img.complete || img.naturalWidth === 0).length,
+    seq: typeof window.__pgSeq === "number" ? window.__pgSeq : null,
+    doc: window.__pgDoc || null
+})
+"""
+
+# Common unexpected elements that indicate errors
+_DEFAULT_UNEXPECTED_SELECTORS = frozenset({
+    ".error",
+    ".alert-danger",
+    ".error-message",
+    "[role='alert']",
+    ".notification.error",
+    ".toast.error",
+    ".modal.error",
+    "#error",
+    ".exception",
+    ".stack-trace"
+})
+
+# Common error texts
+_DEFAULT_PROHIBITED_TEXTS = frozenset({
+    "404 Not Found",
+    "500 Internal Server Error",
+    "Access Denied",
+    "Unauthorized",
+    "Forbidden",
+    "Something went wrong",
+    "An error occurred",
+    "Error:",
+    "Exception:",
+    "Stack trace",
+    "Failed to load",
+    "Connection timeout",
+    "Service unavailable"
+})
+
+# Only the most recent violations are kept
+_HISTORY_LIMIT = 10_000
+
+# Pages already carrying the mutation counter. Init scripts cannot be
+# removed and pages are reused across runs, so it is added once per page.
+_SEQ_PAGES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+class Violation:
+    """A detected violation; converted to a plain dict only at the API boundary"""
+
+    __slots__ = ("type", "selector", "tag", "text", "ts", "extra")
+
+    def __init__(
+        self,
+        type: str,
+        selector: Optional[str] = None,
+        tag: Optional[str] = None,
+        text: Optional[str] = None,
+        ts: Optional[float] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.type = type
+        self.selector = selector
+        self.tag = tag
+        self.text = text
+        self.ts = ts
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Violation":
+        """Wrap a violation dict returned by a custom validator"""
+        extra = dict(data)
+        return cls(extra.pop("type", "unknown"), extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public dict form of the violation"""
+        result: Dict[str, Any] = {"type": self.type}
+        if self.selector is not None:
+            result["selector"] = self.selector
+        if self.tag is not None:
+            result["tag_name"] = self.tag
+        if self.text is not None:
+            result["text"] = self.text
+        if self.extra:
+            result.update(self.extra)
+        if self.ts is not None:
+            result["timestamp"] = self.ts
+        return result
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
 class ViolationDetector:
     """
     💜 Advanced violation detection system
     
     Detects unexpected elements, behaviors, and violations in web applications.
+    Selector rules are evaluated in the page, so they must be CSS selectors.
     """
 
     def __init__(self):
         self.page: Optional[Page] = None
-        self.violations: List[Dict[str, Any]] = []
+        self.violations: Deque[Violation] = deque(maxlen=_HISTORY_LIMIT)
+        self._violations_view: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._type_counts: Counter = Counter()
         self.logger = logging.getLogger("ViolationDetector")
         
         # Detection rules
-        self.unexpected_selectors: Set[str] = set()
-        self.prohibited_texts: Set[str] = set()
+        self.unexpected_selectors: Set[str] = set(_DEFAULT_UNEXPECTED_SELECTORS)
+        self.prohibited_texts: Set[str] = set(_DEFAULT_PROHIBITED_TEXTS)
+        self._prohibited_matcher: Optional[Tuple[List[str], Any]] = None
         self.required_elements: Set[str] = set()
         self.custom_validators: List[Callable] = []
         
         # Detection state
         self.is_active = False
-        self.detection_history: List[Dict[str, Any]] = []
+        self._last_scan: Optional[Tuple[Tuple[int, str, str], List[Violation]]] = None
+
+    @property
+    def detection_history(self) -> Deque[Violation]:
+        """Recorded violations (kept for compatibility; same storage as violations)"""
+        return self.violations
+
+    def clone(self) -> "ViolationDetector":
+        """New detector with the same rules and nothing recorded"""
+        detector = type(self)()
+        detector.unexpected_selectors = set(self.unexpected_selectors)
+        detector.prohibited_texts = set(self.prohibited_texts)
+        detector.required_elements = set(self.required_elements)
+        detector.custom_validators = list(self.custom_validators)
+        return detector
 
     async def setup(self, page: Page):
         """Setup violation detection on the given page"""
         self.page = page
         self.violations.clear()
-        self.detection_history.clear()
+        self._violations_view = None
+        self._type_counts.clear()
+        self._last_scan = None
         
-        # Setup default detection rules
-        await self._setup_default_rules()
+        if page not in _SEQ_PAGES:
+            await page.add_init_script(_MUTATION_SEQ_JS)
+            _SEQ_PAGES.add(page)
         
         self.is_active = True
         self.logger.info("💜 Violation detector activated")
 
-    async def _setup_default_rules(self):
-        """Setup default violation detection rules"""
-        # Common unexpected elements that indicate errors
-        self.unexpected_selectors.update([
-            ".error",
-            ".alert-danger",
-            ".error-message",
-            "[role='alert']",
-            ".notification.error",
-            ".toast.error",
-            ".modal.error",
-            "#error",
-            ".exception",
-            ".stack-trace"
-        ])
-        
-        # Common error texts
-        self.prohibited_texts.update([
-            "404 Not Found",
-            "500 Internal Server Error",
-            "Access Denied",
-            "Unauthorized",
-            "Forbidden",
-            "Something went wrong",
-            "An error occurred",
-            "Error:",
-            "Exception:",
-            "Stack trace",
-            "Failed to load",
-            "Connection timeout",
-            "Service unavailable"
-        ])
-
     async def detect_violations(self) -> List[Dict[str, Any]]:
         """
         Perform comprehensive violation detection
@@ -85,226 +258,293 @@ class ViolationDetector:
         if not self.is_active or not self.page:
             return []
 
+        # An idle, fully loaded page that has not mutated since the last
+        # scan yields the same violations (already recorded)
+        scan_key = await self._get_scan_key()
+        if scan_key is not None and self._last_scan is not None and self._last_scan[0] == scan_key:
+            return [violation.to_dict() for violation in self._last_scan[1]]
+
         current_violations = []
+        timestamp = time.monotonic()  # one timestamp for the whole scan
         
         try:
-            # Check for unexpected elements
-            unexpected_violations = await self._check_unexpected_elements()
-            current_violations.extend(unexpected_violations)
-            
-            # Check for prohibited text content
-            text_violations = await self._check_prohibited_texts()
-            current_violations.extend(text_violations)
-            
-            # Check for required elements
-            missing_violations = await self._check_required_elements()
-            current_violations.extend(missing_violations)
+            # The checks are independent page round-trips; run them together
+            results = await asyncio.gather(
+                self._check_unexpected_elements(timestamp),
+                self._check_prohibited_texts(timestamp),
+                self._check_required_elements(timestamp),
+                self._run_custom_validators(timestamp),
+                self._check_page_state(timestamp),
+                return_exceptions=True
+            )
             
-            # Run custom validators
-            custom_violations = await self._run_custom_validators()
-            current_violations.extend(custom_violations)
-            
-            # Check page state
-            state_violations = await self._check_page_state()
-            current_violations.extend(state_violations)
+            *check_results, (page_violations, scan_mark) = results
+            for result in check_results:
+                if isinstance(result, BaseException):
+                    self.logger.debug("Error during violation check: %s", result)
+                else:
+                    current_violations.extend(result)
+            current_violations.extend(page_violations)
             
             # Record all violations
             for violation in current_violations:
                 self._record_violation(violation)
             
-            return current_violations
+            # A page that mutated while it was being scanned must be rescanned
+            if scan_key is not None and scan_mark == scan_key[:2]:
+                self._last_scan = (scan_key, current_violations)
+            else:
+                self._last_scan = None
+            return [violation.to_dict() for violation in current_violations]
             
         except Exception as e:
-            self.logger.error(f"💜 Error during violation detection: {e}")
+            self.logger.error("💜 Error during violation detection: %s", e)
             return []
 
-    async def _check_unexpected_elements(self) -> List[Dict[str, Any]]:
+    async def _get_scan_key(self) -> Optional[Tuple[int, str, str]]:
+        """Mutation sequence, document token and URL of a settled page, or None if not cacheable"""
+        try:
+            seq, doc, url, ready_state = await self.page.evaluate(_SCAN_PROBE_JS)
+        except Exception as e:
+            self.logger.debug("Error probing page state: %s", e)
+            return None
+        
+        if seq is None or doc is None or ready_state != "complete":
+            return None
+        return (seq, doc, url)
+
+    def _rules_changed(self):
+        """Drop caches derived from the detection rules"""
+        self._prohibited_matcher = None
+        self._last_scan = None
+
+    async def _check_unexpected_elements(self, timestamp: float) -> List[Violation]:
         """Check for unexpected elements on the page"""
         violations = []
+        if not self.unexpected_selectors:
+            return violations
         
-        for selector in self.unexpected_selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    # Get element text and attributes for context
-                    text = await element.text_content()
-                    tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
-                    
-                    violations.append({
-                        "type": "unexpected_element",
-                        "selector": selector,
-                        "tag_name": tag_name,
-                        "text": text[:200] if text else "",  # Limit text length
-                        "timestamp": asyncio.get_event_loop().time()
-                    })
-                    
-            except Exception as e:
-                self.logger.debug(f"Error checking selector {selector}: {e}")
+        try:
+            matches = await self.page.evaluate(
+                _UNEXPECTED_ELEMENTS_JS, list(self.unexpected_selectors)
+            )
+            for match in matches:
+                violations.append(Violation(
+                    "unexpected_element",
+                    selector=match["selector"],
+                    tag=match["tag_name"],
+                    text=match["text"],
+                    ts=timestamp
+                ))
+                
+        except Exception as e:
+            self.logger.debug("Error checking unexpected elements: %s", e)
         
         return violations
 
-    async def _check_prohibited_texts(self) -> List[Dict[str, Any]]:
+    async def _check_prohibited_texts(self, timestamp: float) -> List[Violation]:
         """Check for prohibited text content"""
         violations = []
+        if not self.prohibited_texts:
+            return violations
         
         try:
-            page_content = await self.page.content()
-            page_text = await self.page.evaluate("document.body.textContent")
-            
-            for prohibited_text in self.prohibited_texts:
-                if prohibited_text.lower() in page_text.lower():
-                    violations.append({
-                        "type": "prohibited_text",
-                        "text": prohibited_text,
-                        "found_in": "page_content",
-                        "timestamp": asyncio.get_event_loop().time()
-                    })
+            texts, matcher = self._get_prohibited_matcher()
+            hits = await self.page.evaluate(_PROHIBITED_TEXTS_JS, matcher)
+            for index in hits:
+                violations.append(Violation(
+                    "prohibited_text",
+                    text=texts[index],
+                    ts=timestamp,
+                    extra={"found_in": "page_content"}
+                ))
                     
         except Exception as e:
-            self.logger.debug(f"Error checking prohibited texts: {e}")
+            self.logger.debug("Error checking prohibited texts: %s", e)
         
         return violations
 
-    async def _check_required_elements(self) -> List[Dict[str, Any]]:
+    def _get_prohibited_matcher(self) -> Tuple[List[str], Any]:
+        """Compile prohibited texts into one regex source, cached until rules change"""
+        if self._prohibited_matcher is None:
+            texts = list(self.prohibited_texts)
+            needles = [text.lower() for text in texts]
+            source = "|".join(map(_js_regex_escape, needles))
+            self._prohibited_matcher = (texts, [source, needles])
+        return self._prohibited_matcher
+
+    async def _check_required_elements(self, timestamp: float) -> List[Violation]:
         """Check for required elements that should be present"""
         violations = []
+        if not self.required_elements:
+            return violations
         
-        for selector in self.required_elements:
-            try:
-                element = await self.page.query_selector(selector)
-                if not element:
-                    violations.append({
-                        "type": "missing_required_element",
-                        "selector": selector,
-                        "timestamp": asyncio.get_event_loop().time()
-                    })
-                    
-            except Exception as e:
-                self.logger.debug(f"Error checking required element {selector}: {e}")
+        try:
+            missing = await self.page.evaluate(
+                _MISSING_ELEMENTS_JS, list(self.required_elements)
+            )
+            for selector in missing:
+                violations.append(Violation(
+                    "missing_required_element",
+                    selector=selector,
+                    ts=timestamp
+                ))
+                
+        except Exception as e:
+            self.logger.debug("Error checking required elements: %s", e)
         
         return violations
 
-    async def _run_custom_validators(self) -> List[Dict[str, Any]]:
+    async def _run_custom_validators(self, timestamp: float) -> List[Violation]:
         """Run custom validation functions"""
-        violations = []
+        if not self.custom_validators:
+            return []
         
-        for validator in self.custom_validators:
-            try:
-                result = await validator(self.page)
-                if result:
-                    if isinstance(result, dict):
-                        violations.append(result)
-                    elif isinstance(result, list):
-                        violations.extend(result)
-                    else:
-                        violations.append({
-                            "type": "custom_validation_failure",
-                            "result": str(result),
-                            "validator": validator.__name__,
-                            "timestamp": asyncio.get_event_loop().time()
-                        })
-                        
-            except Exception as e:
-                violations.append({
-                    "type": "custom_validator_error",
-                    "error": str(e),
-                    "validator": validator.__name__,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+        # Validators are independent, so they run concurrently
+        results = await asyncio.gather(
+            *(self._run_custom_validator(validator, timestamp) for validator in self.custom_validators)
+        )
+        return [violation for violations in results for violation in violations]
+
+    async def _run_custom_validator(self, validator: Callable, timestamp: float) -> List[Violation]:
+        """Run one custom validator, turning its result or error into violations"""
+        try:
+            result = await validator(self.page)
+        except Exception as e:
+            return [Violation(
+                "custom_validator_error",
+                ts=timestamp,
+                extra={"error": str(e), "validator": validator.__name__}
+            )]
         
-        return violations
+        if not result:
+            return []
+        if isinstance(result, dict):
+            return [Violation.from_dict(result)]
+        if isinstance(result, list):
+            return [Violation.from_dict(item) for item in result]
+        return [Violation(
+            "custom_validation_failure",
+            ts=timestamp,
+            extra={"result": str(result), "validator": validator.__name__}
+        )]
 
-    async def _check_page_state(self) -> List[Dict[str, Any]]:
-        """Check overall page state for violations"""
+    async def _check_page_state(self, timestamp: float) -> Tuple[List[Violation], Optional[Tuple[int, str]]]:
+        """
+        Check overall page state for violations
+        
+        Returns:
+            The violations and the page's (mutation sequence, document token),
+            None if unknown
+        """
         violations = []
+        mark = None
         
         try:
+            state = await self.page.evaluate(_PAGE_STATE_JS)
+            mark = (state["seq"], state["doc"])
+            
             # Check if page is still loading
-            ready_state = await self.page.evaluate("document.readyState")
+            ready_state = state["ready"]
             if ready_state != "complete":
-                violations.append({
-                    "type": "page_not_ready",
-                    "ready_state": ready_state,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+                violations.append(Violation(
+                    "page_not_ready",
+                    ts=timestamp,
+                    extra={"ready_state": ready_state}
+                ))
             
             # Check for JavaScript errors in console
             # Note: Console errors are typically caught by monitors, but we double-check here
             
             # Check for broken images
-            broken_images = await self.page.evaluate("""
-                Array.from(document.images).filter(img => !img.complete || img.naturalWidth === 0).length
-            """)
-            
+            broken_images = state["broken"]
             if broken_images > 0:
-                violations.append({
-                    "type": "broken_images",
-                    "count": broken_images,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+                violations.append(Violation(
+                    "broken_images",
+                    ts=timestamp,
+                    extra={"count": broken_images}
+                ))
                 
         except Exception as e:
-            self.logger.debug(f"Error checking page state: {e}")
+            self.logger.debug("Error checking page state: %s", e)
         
-        return violations
+        return violations, mark
 
-    def _record_violation(self, violation: Dict[str, Any]):
+    def _record_violation(self, violation: Violation):
         """Record a violation in the history"""
-        self.violations.append(violation)
-        self.detection_history.append(violation)
+        violations = self.violations
+        if len(violations) == violations.maxlen:
+            # The oldest violation is dropped; keep the per-type counts in step
+            oldest = violations[0].type
+            self._type_counts[oldest] -= 1
+            if not self._type_counts[oldest]:
+                del self._type_counts[oldest]
+        violations.append(violation)
+        self._violations_view = None
+        self._type_counts[violation.type] += 1
         
-        self.logger.warning(f"💜 Violation detected: {violation['type']} - {violation}")
+        # The violation repr builds a dict, so skip it when warnings are filtered
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("💜 Violation detected: %s - %r", violation.type, violation)
 
     def add_unexpected_selector(self, selector: str):
         """Add a selector that should not appear on the page"""
         self.unexpected_selectors.add(selector)
-        self.logger.info(f"💜 Added unexpected selector: {selector}")
+        self._rules_changed()
+        self.logger.info("💜 Added unexpected selector: %s", selector)
 
     def add_prohibited_text(self, text: str):
         """Add text that should not appear on the page"""
         self.prohibited_texts.add(text)
-        self.logger.info(f"💜 Added prohibited text: {text}")
+        self._rules_changed()
+        self.logger.info("💜 Added prohibited text: %s", text)
 
     def add_required_element(self, selector: str):
         """Add a selector that must be present on the page"""
         self.required_elements.add(selector)
-        self.logger.info(f"💜 Added required element: {selector}")
+        self._rules_changed()
+        self.logger.info("💜 Added required element: %s", selector)
 
     def add_custom_validator(self, validator: Callable):
         """Add a custom validation function"""
         self.custom_validators.append(validator)
-        self.logger.info(f"💜 Added custom validator: {validator.__name__}")
+        self._rules_changed()
+        self.logger.info("💜 Added custom validator: %s", validator.__name__)
 
     def remove_unexpected_selector(self, selector: str):
         """Remove an unexpected selector"""
         self.unexpected_selectors.discard(selector)
+        self._rules_changed()
 
     def remove_prohibited_text(self, text: str):
         """Remove a prohibited text"""
         self.prohibited_texts.discard(text)
+        self._rules_changed()
 
     def remove_required_element(self, selector: str):
         """Remove a required element"""
         self.required_elements.discard(selector)
+        self._rules_changed()
 
     def has_violations(self) -> bool:
         """Check if any violations were detected"""
         return len(self.violations) > 0
 
-    def get_violations(self) -> List[Dict[str, Any]]:
+    def get_violations(self) -> Tuple[Dict[str, Any], ...]:
         """Get all detected violations"""
-        return self.violations.copy()
+        if self._violations_view is None:
+            self._violations_view = tuple(violation.to_dict() for violation in self.violations)
+        return self._violations_view
+
+    async def get_violations_async(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all detected violations (awaitable, for final state checks)"""
+        return self.get_violations()
 
     def get_violation_summary(self) -> Dict[str, Any]:
         """Get summary of detected violations"""
-        violation_counts = {}
-        for violation in self.violations:
-            violation_type = violation.get("type", "unknown")
-            violation_counts[violation_type] = violation_counts.get(violation_type, 0) + 1
-        
         return {
             "total_violations": len(self.violations),
-            "violation_types": violation_counts,
+            "violation_types": dict(self._type_counts),
             "is_active": self.is_active,
             "rules_count": {
                 "unexpected_selectors": len(self.unexpected_selectors),
@@ -317,7 +557,9 @@ class ViolationDetector:
     def reset(self):
         """Reset violation detector state"""
         self.violations.clear()
-        self.detection_history.clear()
+        self._violations_view = None
+        self._type_counts.clear()
+        self._last_scan = None
         self.is_active = False
 
     def clear_rules(self):
@@ -326,4 +568,5 @@ class ViolationDetector:
         self.prohibited_texts.clear()
         self.required_elements.clear()
         self.custom_validators.clear()
+        self._rules_changed()
         self.logger.info("💜 All detection rules cleared")
\ No newline at end of file
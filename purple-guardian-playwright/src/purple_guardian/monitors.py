@@ -4,10 +4,95 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Set, Optional
+import time
+import weakref
+from collections import Counter, deque
+from typing import List, Dict, Any, Set, Optional, Deque, Tuple
 from playwright.async_api import Page
 
 
+# DOM mutation observer; mutations are coalesced per (type, target tag) in
+# the page so the buffer stays bounded on busy pages
+_MUTATION_OBSERVER_JS = """
+(() => {
+    const MAX_KEYS = 5000;
+    const observer = new MutationObserver((mutations) => {
+        const buffer = window.purpleGuardianMutations || (window.purpleGuardianMutations = new Map());
+        for (const mutation of mutations) {
+            const key = mutation.type + "|" + mutation.target.tagName;
+            const entry = buffer.get(key);
+            if (entry) {
+                entry.count += 1;
+                entry.addedNodes += mutation.addedNodes.length;
+                entry.removedNodes += mutation.removedNodes.length;
+                entry.timestamp = Date.now();
+            } else if (buffer.size < MAX_KEYS) {
+                buffer.set(key, {
+                    type: mutation.type,
+                    target: mutation.target.tagName,
+                    addedNodes: mutation.addedNodes.length,
+                    removedNodes: mutation.removedNodes.length,
+                    count: 1,
+                    timestamp: Date.now()
+                });
+            } else {
+                window.purpleGuardianMutationsDropped = (window.purpleGuardianMutationsDropped || 0) + 1;
+            }
+        }
+    });
+    
+    // document.body does not exist yet when init scripts run
+    observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeOldValue: true
+    });
+})();
+"""
+
+# Read and reset the mutation buffer in one round-trip
+_DRAIN_MUTATIONS_JS = """
+() => {
+    const buffer = window.purpleGuardianMutations;
+    const dropped = window.purpleGuardianMutationsDropped || 0;
+    window.purpleGuardianMutations = new Map();
+    window.purpleGuardianMutationsDropped = 0;
+    return {
+        mutations: buffer ? Array.from(buffer.values()) : [],
+        dropped: dropped
+    };
+}
+"""
+
+# Presence bitmap for a list of selectors, one round-trip
+# null marks a selector the DOM can't parse (text=, xpath=, >> ...), which
+# is then resolved through Playwright's own selector engine
+_PRESENCE_JS = """
+(selectors) => selectors.map((selector) => {
+  try {
+    return document.querySelector(selector) !== null;
+  } catch (e) {
+    return null;
+  }
+})
+"""
+
+
+# Event logs keep only the most recent entries so long sessions stay bounded
+_EVENT_LOG_LIMIT = 10_000
+
+# Console errors are recorded once per distinct message per window (seconds)
+_CONSOLE_WINDOW = 0.05
+
+# Most page events recorded per pass of the event task
+_EVENT_BATCH = 256
+
+# Pages already carrying the mutation observer. Init scripts cannot be
+# removed and pages are reused across runs, so it is added once per page.
+_OBSERVED_PAGES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
 class StrictMonitor:
     """
     💜 Strict monitoring system that tracks page state and detects violations
@@ -22,17 +107,45 @@ class StrictMonitor:
         
         # Monitoring state
         self.is_monitoring = False
-        self.dom_mutations: List[Dict[str, Any]] = []
-        self.network_requests: List[Dict[str, Any]] = []
-        self.console_messages: List[Dict[str, Any]] = []
+        self.dom_mutations: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_LOG_LIMIT)
+        self.network_requests: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_LOG_LIMIT)
+        self.console_messages: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_LOG_LIMIT)
+        
+        # Read-only snapshots handed out by the getters, dropped on change
+        self._views: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+        
+        # Console errors waiting for the end of the current window
+        self._console_buffer: Counter = Counter()
+        self._console_flush: Optional[asyncio.TimerHandle] = None
+        
+        # Page events are queued by the handlers and recorded in batches
+        self._events: Optional[asyncio.Queue] = None
+        self._event_task: Optional[asyncio.Task] = None
+        
+        # Page the event handlers are attached to, detached on stop
+        self._listening: Optional[Page] = None
+
+    def clone(self) -> "StrictMonitor":
+        """New monitor with the same expected/forbidden elements and nothing recorded"""
+        monitor = type(self)()
+        monitor.expected_elements = set(self.expected_elements)
+        monitor.forbidden_elements = set(self.forbidden_elements)
+        return monitor
 
     async def setup(self, page: Page):
         """Setup monitoring on the given page"""
+        self._detach_listeners()
         self.page = page
         self.violations.clear()
         self.dom_mutations.clear()
         self.network_requests.clear()
         self.console_messages.clear()
+        self._views.clear()
+        self._discard_console_buffer()
+        self._stop_event_task()
+        
+        self._events = asyncio.Queue()
+        self._event_task = asyncio.ensure_future(self._process_events())
         
         # Setup event listeners
         await self._setup_listeners()
@@ -42,28 +155,9 @@ class StrictMonitor:
     async def _setup_listeners(self):
         """Setup all monitoring listeners"""
         # DOM mutation observer
-        await self.page.add_init_script("""
-            // DOM Mutation Observer
-            const observer = new MutationObserver((mutations) => {
-                mutations.forEach((mutation) => {
-                    window.purpleGuardianMutations = window.purpleGuardianMutations || [];
-                    window.purpleGuardianMutations.push({
-                        type: mutation.type,
-                        target: mutation.target.tagName,
-                        addedNodes: mutation.addedNodes.length,
-                        removedNodes: mutation.removedNodes.length,
-                        timestamp: Date.now()
-                    });
-                });
-            });
-            
-            observer.observe(document.body, {
-                childList: true,
-                subtree: true,
-                attributes: true,
-                attributeOldValue: true
-            });
-        """)
+        if self.page not in _OBSERVED_PAGES:
+            await self.page.add_init_script(_MUTATION_OBSERVER_JS)
+            _OBSERVED_PAGES.add(self.page)
 
         # Network request monitoring
         self.page.on("request", self._on_request)
@@ -74,144 +168,275 @@ class StrictMonitor:
         
         # Page error monitoring
         self.page.on("pageerror", self._on_page_error)
+        self._listening = self.page
+
+    def _detach_listeners(self):
+        """Detach the event handlers from the page they were attached to"""
+        page, self._listening = self._listening, None
+        if page is not None:
+            page.remove_listener("request", self._on_request)
+            page.remove_listener("response", self._on_response)
+            page.remove_listener("console", self._on_console)
+            page.remove_listener("pageerror", self._on_page_error)
 
     def _on_request(self, request):
         """Handle network request"""
-        self.network_requests.append({
-            "type": "request",
-            "url": request.url,
-            "method": request.method,
-            "timestamp": asyncio.get_event_loop().time()
-        })
+        self._events.put_nowait(("request", request.url, request.method, time.monotonic()))
 
     def _on_response(self, response):
         """Handle network response"""
-        self.network_requests.append({
-            "type": "response",
-            "url": response.url,
-            "status": response.status,
-            "timestamp": asyncio.get_event_loop().time()
-        })
+        self._events.put_nowait(("response", response.url, response.status, time.monotonic()))
 
     def _on_console(self, message):
         """Handle console message"""
-        self.console_messages.append({
-            "type": message.type,
-            "text": message.text,
-            "timestamp": asyncio.get_event_loop().time()
-        })
+        self._events.put_nowait(("console", message.type, message.text, time.monotonic()))
+
+    def _on_page_error(self, error):
+        """Handle page error"""
+        self._events.put_nowait(("pageerror", str(error), None, time.monotonic()))
+
+    async def _process_events(self):
+        """Record queued page events in batches as they arrive"""
+        while True:
+            batch = [await self._events.get()]
+            self._drain_events(batch, _EVENT_BATCH)
+            
+            # Noisy pages repeat console errors, so they are coalesced and
+            # recorded when the window closes
+            if self._console_buffer and self._console_flush is None:
+                self._console_flush = asyncio.get_running_loop().call_later(
+                    _CONSOLE_WINDOW, self._flush_console
+                )
+
+    def _drain_events(self, batch: List[tuple], limit: Optional[int] = None):
+        """Take up to limit queued events (all if None) and record them with batch"""
+        events = self._events
+        while (limit is None or len(batch) < limit) and not events.empty():
+            batch.append(events.get_nowait())
         
-        # Check for error messages
-        if message.type in ["error", "warning"]:
+        network_requests = []
+        console_messages = []
+        for kind, first, second, timestamp in batch:
+            if kind == "request":
+                network_requests.append({
+                    "type": "request",
+                    "url": first,
+                    "method": second,
+                    "timestamp": timestamp
+                })
+            elif kind == "response":
+                network_requests.append({
+                    "type": "response",
+                    "url": first,
+                    "status": second,
+                    "timestamp": timestamp
+                })
+            elif kind == "console":
+                console_messages.append({
+                    "type": first,
+                    "text": second,
+                    "timestamp": timestamp
+                })
+                # Check for error messages
+                if first in ("error", "warning"):
+                    self._console_buffer[(first, second)] += 1
+            else:
+                self._add_violation("page_error", {
+                    "message": first,
+                    "timestamp": timestamp
+                }, timestamp)
+        
+        if network_requests:
+            self._views.pop("network_requests", None)
+            self.network_requests.extend(network_requests)
+        if console_messages:
+            self._views.pop("console_messages", None)
+            self.console_messages.extend(console_messages)
+
+    def _catch_up(self):
+        """Record queued events and pending console errors before state is read"""
+        if self._events is not None and not self._events.empty():
+            self._drain_events([])
+        if self._console_buffer:
+            self._flush_console()
+
+    def _stop_event_task(self):
+        """Stop recording queued events"""
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+
+    def _flush_console(self):
+        """Record buffered console errors, one violation per distinct message"""
+        if self._console_flush is not None:
+            self._console_flush.cancel()
+            self._console_flush = None
+        
+        buffered, self._console_buffer = self._console_buffer, Counter()
+        for (message_type, text), count in buffered.items():
             self._add_violation("console_error", {
-                "message": message.text,
-                "type": message.type
+                "message": text,
+                "type": message_type,
+                "count": count
             })
 
-    def _on_page_error(self, error):
-        """Handle page error"""
-        self._add_violation("page_error", {
-            "message": str(error),
-            "timestamp": asyncio.get_event_loop().time()
-        })
+    def _discard_console_buffer(self):
+        """Drop console errors that have not been recorded yet"""
+        if self._console_flush is not None:
+            self._console_flush.cancel()
+            self._console_flush = None
+        self._console_buffer.clear()
+
+    async def _presence(self, selectors: List[str]) -> List[bool]:
+        """Presence flags for selectors, one round trip for plain CSS"""
+        present = await self.page.evaluate(_PRESENCE_JS, selectors)
+        for index, found in enumerate(present):
+            if found is None:
+                present[index] = await self.page.query_selector(selectors[index]) is not None
+        return present
 
     async def check_expected_elements(self, selectors: List[str]):
         """Check that expected elements are present"""
-        for selector in selectors:
-            self.expected_elements.add(selector)
-            element = await self.page.query_selector(selector)
-            if not element:
+        selectors = list(selectors)
+        self.expected_elements.update(selectors)
+        if not selectors:
+            return
+        
+        present = await self._presence(selectors)
+        timestamp = time.monotonic()
+        for selector, found in zip(selectors, present):
+            if not found:
                 self._add_violation("missing_expected_element", {
                     "selector": selector,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+                    "timestamp": timestamp
+                }, timestamp)
 
     async def check_forbidden_elements(self, selectors: List[str]):
         """Check that forbidden elements are not present"""
-        for selector in selectors:
-            self.forbidden_elements.add(selector)
-            element = await self.page.query_selector(selector)
-            if element:
+        selectors = list(selectors)
+        self.forbidden_elements.update(selectors)
+        if not selectors:
+            return
+        
+        present = await self._presence(selectors)
+        timestamp = time.monotonic()
+        for selector, found in zip(selectors, present):
+            if found:
                 self._add_violation("forbidden_element_found", {
                     "selector": selector,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+                    "timestamp": timestamp
+                }, timestamp)
 
     async def check_dom_mutations(self) -> List[Dict[str, Any]]:
-        """Get DOM mutations that occurred"""
+        """Get DOM mutations that occurred, coalesced per type and target tag"""
         try:
-            mutations = await self.page.evaluate("window.purpleGuardianMutations || []")
-            self.dom_mutations.extend(mutations)
+            drained = await self.page.evaluate(_DRAIN_MUTATIONS_JS)
+            mutations = drained["mutations"]
+            if mutations:
+                self._views.pop("dom_mutations", None)
+                self.dom_mutations.extend(mutations)
             
-            # Clear mutations from page
-            await self.page.evaluate("window.purpleGuardianMutations = []")
+            if drained["dropped"]:
+                self.logger.debug("💜 %d DOM mutations dropped (buffer full)", drained["dropped"])
             
             return mutations
         except Exception as e:
-            self.logger.warning(f"Failed to check DOM mutations: {e}")
+            self.logger.warning("Failed to check DOM mutations: %s", e)
             return []
 
-    def _add_violation(self, violation_type: str, details: Dict[str, Any]):
+    def _add_violation(
+        self,
+        violation_type: str,
+        details: Dict[str, Any],
+        timestamp: Optional[float] = None
+    ):
         """Add a violation to the list"""
         violation = {
             "type": violation_type,
             "details": details,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic() if timestamp is None else timestamp
         }
+        self._views.pop("violations", None)
         self.violations.append(violation)
-        self.logger.warning(f"💜 Violation detected: {violation_type} - {details}")
+        self.logger.warning("💜 Violation detected: %s - %s", violation_type, details)
 
     def has_violations(self) -> bool:
         """Check if any violations were detected"""
+        self._catch_up()
         return len(self.violations) > 0
 
-    def get_violations(self) -> List[Dict[str, Any]]:
+    def _view(self, name: str) -> Tuple[Dict[str, Any], ...]:
+        """Snapshot of a recorded list, rebuilt only after it changed"""
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = tuple(getattr(self, name))
+        return view
+
+    def get_violations(self) -> Tuple[Dict[str, Any], ...]:
         """Get all detected violations"""
-        return self.violations.copy()
+        self._catch_up()
+        return self._view("violations")
+
+    async def get_violations_async(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all detected violations (awaitable, for final state checks)"""
+        return self.get_violations()
 
-    def get_dom_mutations(self) -> List[Dict[str, Any]]:
+    def get_dom_mutations(self) -> Tuple[Dict[str, Any], ...]:
         """Get all DOM mutations"""
-        return self.dom_mutations.copy()
+        return self._view("dom_mutations")
 
-    def get_network_requests(self) -> List[Dict[str, Any]]:
+    def get_network_requests(self) -> Tuple[Dict[str, Any], ...]:
         """Get all network requests"""
-        return self.network_requests.copy()
+        self._catch_up()
+        return self._view("network_requests")
 
-    def get_console_messages(self) -> List[Dict[str, Any]]:
+    def get_console_messages(self) -> Tuple[Dict[str, Any], ...]:
         """Get all console messages"""
-        return self.console_messages.copy()
+        self._catch_up()
+        return self._view("console_messages")
 
     async def validate_state(self):
         """Perform comprehensive state validation"""
-        # Check expected elements
-        for selector in self.expected_elements:
-            await self.check_expected_elements([selector])
-        
-        # Check forbidden elements
-        for selector in self.forbidden_elements:
-            await self.check_forbidden_elements([selector])
-        
-        # Check DOM mutations
-        await self.check_dom_mutations()
+        # Expected/forbidden elements and DOM mutations are checked concurrently
+        await asyncio.gather(
+            self.check_expected_elements(list(self.expected_elements)),
+            self.check_forbidden_elements(list(self.forbidden_elements)),
+            self.check_dom_mutations()
+        )
         
         # Report status
         if self.has_violations():
-            self.logger.error(f"💜 State validation failed: {len(self.violations)} violations")
+            self.logger.error("💜 State validation failed: %d violations", len(self.violations))
         else:
             self.logger.info("💜 State validation passed")
 
+    def stop(self):
+        """Stop monitoring the page; everything recorded so far stays available"""
+        self._detach_listeners()
+        self._catch_up()
+        self._stop_event_task()
+        self.is_monitoring = False
+
     def reset(self):
         """Reset monitoring state"""
+        self._detach_listeners()
         self.violations.clear()
         self.dom_mutations.clear()
         self.network_requests.clear()
         self.console_messages.clear()
+        self._views.clear()
+        self._discard_console_buffer()
+        self._stop_event_task()
+        if self._events is not None:
+            while not self._events.empty():
+                self._events.get_nowait()
         self.expected_elements.clear()
         self.forbidden_elements.clear()
         self.is_monitoring = False
 
     def get_summary(self) -> Dict[str, Any]:
         """Get monitoring summary"""
+        self._catch_up()
         return {
             "is_monitoring": self.is_monitoring,
             "violations_count": len(self.violations),
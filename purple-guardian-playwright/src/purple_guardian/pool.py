@@ -0,0 +1,69 @@
+"""
+💜 Page pooling for Purple Guardian
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+from playwright.async_api import BrowserContext, Page
+
+
+class PagePool:
+    """
+    💜 Bounded pool of pages sharing one browser context
+
+    Pages are opened on demand, at most ``size`` at a time. With
+    ``reuse_pages`` a released page is kept open for the next borrower
+    instead of being closed. Create the pool inside a running event loop.
+    """
+
+    def __init__(self, context: BrowserContext, size: int = 4, reuse_pages: bool = True):
+        self.context = context
+        self.size = max(1, size)
+        self.reuse_pages = reuse_pages
+        self._idle: List[Page] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self) -> Page:
+        """Borrow a page, waiting while all pages are in use"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        await self._slots.acquire()
+
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    return page
+            return await self.context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, page: Page, reuse: bool = True):
+        """Return a borrowed page to the pool; with reuse=False it is closed"""
+        try:
+            if reuse and self.reuse_pages and not page.is_closed():
+                self._idle.append(page)
+            else:
+                await page.close()
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a page for the duration of the block"""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self):
+        """Close the idle pages; borrowed pages are closed on release"""
+        idle, self._idle = self._idle, []
+        self.reuse_pages = False
+        await asyncio.gather(*(page.close() for page in idle), return_exceptions=True)
+
+    def __repr__(self) -> str:
+        return f"PagePool(size={self.size}, idle={len(self._idle)})"
@@ -4,7 +4,10 @@
 
 import asyncio
 import logging
+import math
 import random
+import time
+from collections import deque
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -18,6 +21,19 @@ class RestartType(Enum):
     CUSTOM = "custom"
 
 
+# Only the most recent restarts are kept in the history
+_HISTORY_LIMIT = 10_000
+
+# Delay method for each strategy type, bound once when the type is set
+_DELAY_METHODS = {
+    RestartType.IMMEDIATE: "_immediate_delay",
+    RestartType.LINEAR: "_linear_delay",
+    RestartType.EXPONENTIAL: "_exponential_delay",
+    RestartType.RANDOM: "_random_delay",
+    RestartType.CUSTOM: "_custom_delay"
+}
+
+
 class RestartStrategy:
     """
     💜 Restart strategy manager for Purple Guardian
@@ -35,18 +51,58 @@ class RestartStrategy:
         custom_delays: Optional[list] = None
     ):
         self.strategy_type = strategy_type
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.backoff_factor = backoff_factor
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._backoff_factor = backoff_factor
         self.jitter = jitter
         self.custom_delays = custom_delays or []
         
         self.logger = logging.getLogger("RestartStrategy")
         
+        self._update_max_attempt()
+        
         # Statistics
         self.restart_count = 0
         self.total_delay_time = 0.0
-        self.restart_history: list = []
+        self.restart_history: deque = deque(maxlen=_HISTORY_LIMIT)
+
+    @property
+    def strategy_type(self) -> RestartType:
+        return self._strategy_type
+
+    @strategy_type.setter
+    def strategy_type(self, strategy_type: RestartType):
+        self._strategy_type = strategy_type
+        self._delay_fn = getattr(self, _DELAY_METHODS.get(strategy_type, "_fixed_delay"))
+
+    # The exponential clamp depends on these three, so setting any recomputes it
+
+    @property
+    def base_delay(self) -> float:
+        return self._base_delay
+
+    @base_delay.setter
+    def base_delay(self, base_delay: float):
+        self._base_delay = base_delay
+        self._update_max_attempt()
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, max_delay: float):
+        self._max_delay = max_delay
+        self._update_max_attempt()
+
+    @property
+    def backoff_factor(self) -> float:
+        return self._backoff_factor
+
+    @backoff_factor.setter
+    def backoff_factor(self, backoff_factor: float):
+        self._backoff_factor = backoff_factor
+        self._update_max_attempt()
 
     def get_delay(self, attempt: int) -> float:
         """
@@ -74,35 +130,49 @@ class RestartStrategy:
             "attempt": attempt,
             "delay": delay,
             "strategy": self.strategy_type.value,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
         
-        self.logger.info(f"💜 Restart delay calculated: {delay:.2f}s (attempt {attempt + 1})")
+        self.logger.info("💜 Restart delay calculated: %.2fs (attempt %d)", delay, attempt + 1)
         return delay
 
     def _calculate_base_delay(self, attempt: int) -> float:
         """Calculate base delay without jitter"""
-        if self.strategy_type == RestartType.IMMEDIATE:
-            return 0.0
-        
-        elif self.strategy_type == RestartType.LINEAR:
-            return self.base_delay * (attempt + 1)
-        
-        elif self.strategy_type == RestartType.EXPONENTIAL:
-            return self.base_delay * (self.backoff_factor ** attempt)
-        
-        elif self.strategy_type == RestartType.RANDOM:
-            return random.uniform(self.base_delay, self.base_delay * 5)
-        
-        elif self.strategy_type == RestartType.CUSTOM:
-            if attempt < len(self.custom_delays):
-                return self.custom_delays[attempt]
-            else:
-                # Use last delay or exponential fallback
-                return self.custom_delays[-1] if self.custom_delays else self.base_delay
-        
+        return self._delay_fn(attempt)
+
+    def _fixed_delay(self, attempt: int) -> float:
+        return self.base_delay
+
+    def _immediate_delay(self, attempt: int) -> float:
+        return 0.0
+
+    def _linear_delay(self, attempt: int) -> float:
+        return self.base_delay * (attempt + 1)
+
+    def _exponential_delay(self, attempt: int) -> float:
+        # Attempts past the one that reaches max_delay would only be clamped
+        return self.base_delay * (self.backoff_factor ** min(attempt, self._max_attempt))
+
+    def _random_delay(self, attempt: int) -> float:
+        return random.uniform(self.base_delay, self.base_delay * 5)
+
+    def _custom_delay(self, attempt: int) -> float:
+        if attempt < len(self.custom_delays):
+            return self.custom_delays[attempt]
+        # Use last delay or base delay fallback
+        return self.custom_delays[-1] if self.custom_delays else self.base_delay
+
+    def _update_max_attempt(self):
+        """Precompute the first exponential attempt whose delay reaches max_delay"""
+        if self.base_delay <= 0 or self.max_delay <= self.base_delay:
+            self._max_attempt = 0
+        elif self.backoff_factor <= 1:
+            # The delay never grows, so there is nothing to clamp
+            self._max_attempt = math.inf
         else:
-            return self.base_delay
+            self._max_attempt = math.ceil(
+                math.log(self.max_delay / self.base_delay) / math.log(self.backoff_factor)
+            )
 
     def _apply_jitter(self, delay: float) -> float:
         """Apply random jitter to delay"""
@@ -120,7 +190,7 @@ class RestartStrategy:
         delay = self.get_delay(attempt)
         
         if delay > 0:
-            self.logger.info(f"💜 Waiting {delay:.2f}s before restart...")
+            self.logger.info("💜 Waiting %.2fs before restart...", delay)
             
             # Show countdown for longer delays
             if delay > 5:
@@ -130,16 +200,24 @@ class RestartStrategy:
 
     async def _countdown_wait(self, delay: float, interval: float = 1.0):
         """Wait with countdown display"""
-        remaining = delay
+        # Sleep once; the countdown messages are scheduled on the loop
+        # instead of waking up every interval
+        loop = asyncio.get_running_loop()
+        handles = [
+            loop.call_later(
+                step * interval,
+                self.logger.info,
+                "💜 Restarting in %.0fs...",
+                delay - step * interval
+            )
+            for step in range(int(delay // interval))
+        ]
         
-        while remaining > 0:
-            if remaining >= interval:
-                self.logger.info(f"💜 Restarting in {remaining:.0f}s...")
-                await asyncio.sleep(interval)
-                remaining -= interval
-            else:
-                await asyncio.sleep(remaining)
-                remaining = 0
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            for handle in handles:
+                handle.cancel()
 
     def reset_statistics(self):
         """Reset restart statistics"""
@@ -154,7 +232,7 @@ class RestartStrategy:
             "restart_count": self.restart_count,
             "total_delay_time": self.total_delay_time,
             "average_delay": self.total_delay_time / max(1, self.restart_count),
-            "restart_history": self.restart_history.copy(),
+            "restart_history": list(self.restart_history),
             "config": {
                 "base_delay": self.base_delay,
                 "max_delay": self.max_delay,
@@ -173,19 +251,19 @@ class RestartStrategy:
         """Dynamically adjust strategy parameters"""
         if base_delay is not None:
             self.base_delay = base_delay
-            self.logger.info(f"💜 Base delay adjusted to {base_delay}s")
+            self.logger.info("💜 Base delay adjusted to %ss", base_delay)
         
         if max_delay is not None:
             self.max_delay = max_delay
-            self.logger.info(f"💜 Max delay adjusted to {max_delay}s")
+            self.logger.info("💜 Max delay adjusted to %ss", max_delay)
         
         if backoff_factor is not None:
             self.backoff_factor = backoff_factor
-            self.logger.info(f"💜 Backoff factor adjusted to {backoff_factor}")
+            self.logger.info("💜 Backoff factor adjusted to %s", backoff_factor)
         
         if jitter is not None:
             self.jitter = jitter
-            self.logger.info(f"💜 Jitter {'enabled' if jitter else 'disabled'}")
+            self.logger.info("💜 Jitter %s", "enabled" if jitter else "disabled")
 
     @classmethod
     def create_immediate(cls):
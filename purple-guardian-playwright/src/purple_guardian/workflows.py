@@ -2,24 +2,211 @@
 💜 Workflow base classes and implementations
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from playwright.async_api import Page
+import asyncio
+from itertools import groupby
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from playwright.async_api import BrowserContext, Locator, Page
+from playwright.async_api import TimeoutError as PWTimeout
 
+from .pool import PagePool
 
-class Workflow(ABC):
+
+# Apply a run of fill/click ops in one round-trip. Fills set the value and
+# fire the input/change events page.fill would; a click (only ever the last
+# op) runs once every fill before it has been applied. Ops on elements the
+# page cannot resolve with document.querySelector, hidden or disabled
+# elements, fields that are not text-like and values the field does not
+# keep as given (number/date inputs sanitise bad ones to "") are left alone
+# and their indexes returned so Playwright can perform them, in order.
+_BATCH_OPS_JS = """
+(ops) => {
+    const NOT_TEXT = ["checkbox", "radio", "file", "button", "submit", "image", "reset"];
+    const pending = [];
+    ops.forEach(([kind, selector, value], index) => {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {}
+        if (kind === "fill") {
+            const fillable = el && !el.disabled && !el.readOnly && el.getClientRects().length > 0 && (
+                el instanceof HTMLTextAreaElement ||
+                (el instanceof HTMLInputElement && !NOT_TEXT.includes(el.type))
+            );
+            if (!fillable) {
+                pending.push(index);
+                return;
+            }
+            // Use the native setter so framework value trackers see the change
+            Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set.call(el, value);
+            if (el.value !== value) {
+                pending.push(index);
+                return;
+            }
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+        } else {
+            const clickable = pending.length === 0 && el && !el.disabled && el.getClientRects().length > 0;
+            if (!clickable) {
+                pending.push(index);
+                return;
+            }
+            el.click();
+        }
+    });
+    return pending;
+}
+"""
+
+
+# Clear what the previous run left in the page's origin. Opaque origins
+# (about:blank, data: URLs) have no storage and throw on access.
+_CLEAR_STORAGE_JS = """
+() => {
+    try {
+        localStorage.clear();
+        sessionStorage.clear();
+    } catch (e) {}
+}
+"""
+
+# Pages left by earlier runs, pooled per browser context (by id) until the
+# context closes
+_PAGE_POOLS: Dict[int, PagePool] = {}
+
+
+def _page_pool(context: BrowserContext) -> PagePool:
+    key = id(context)
+    pool = _PAGE_POOLS.get(key)
+    if pool is None:
+        pool = _PAGE_POOLS[key] = PagePool(context)
+        
+        def forget(_):
+            if _PAGE_POOLS.get(key) is pool:
+                del _PAGE_POOLS[key]
+        context.on("close", forget)
+    return pool
+
+
+class _Locators:
+    """Locators interned by selector for the page they were created on"""
+
+    __slots__ = ("_page", "_by_selector")
+
+    def __init__(self):
+        self._page: Optional[Page] = None
+        self._by_selector: Dict[str, Locator] = {}
+
+    def __call__(self, page: Page, selector: str) -> Locator:
+        if page is not self._page:
+            self._page = page
+            self._by_selector = {}
+        
+        locator = self._by_selector.get(selector)
+        if locator is None:
+            # .first keeps page.click/page.fill's first-match (non-strict) behaviour
+            locator = self._by_selector[selector] = page.locator(selector).first
+        return locator
+
+
+async def _apply_ops(page: Page, ops: List[List[Any]], locators: _Locators):
+    """Apply fill/click ops with one evaluate; locators handle the rest"""
+    if len(ops) > 1:
+        pending = await page.evaluate(_BATCH_OPS_JS, ops)
+        ops = [ops[index] for index in pending]
+    
+    for kind, selector, value in ops:
+        if kind == "fill":
+            await locators(page, selector).fill(value)
+        else:
+            await locators(page, selector).click()
+
+
+def _fusible_kind(action: Any) -> Optional[str]:
+    if isinstance(action, dict) and action.get("type") in ("fill", "click"):
+        return action["type"]
+    return None
+
+
+def _action_group(action: Any) -> Any:
+    return action.get("group") if isinstance(action, dict) else None
+
+
+# A compiled plan step runs against the page and returns its action results
+_Step = Callable[[Page], Awaitable[List[Any]]]
+
+
+def _single_step(run: Callable[[Page], Awaitable[Any]]) -> _Step:
+    async def step(page: Page) -> List[Any]:
+        return [await run(page)]
+    return step
+
+
+def _concurrent_step(runs: List[Callable[[Page], Awaitable[Any]]]) -> _Step:
+    async def step(page: Page) -> List[Any]:
+        return list(await asyncio.gather(*(run(page) for run in runs)))
+    return step
+
+
+def _ops_step(actions: List[Dict[str, Any]], locators: _Locators) -> _Step:
+    ops = [
+        ["fill", action["selector"], action["value"]] if action["type"] == "fill"
+        else ["click", action["selector"], None]
+        for action in actions
+    ]
+    messages = [
+        f"Filled: {selector} = {value}" if kind == "fill" else f"Clicked: {selector}"
+        for kind, selector, value in ops
+    ]
+    
+    async def step(page: Page) -> List[Any]:
+        await _apply_ops(page, ops, locators)
+        return list(messages)
+    return step
+
+
+async def _prefetch(context: BrowserContext, url: str):
+    """Start loading a URL on a throwaway page to warm DNS and connections"""
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="commit")
+    finally:
+        await page.close()
+
+
+def _check_group(actions: List[Dict[str, Any]]):
+    """Reject groups that would click and fill the same element concurrently"""
+    clicked = {action.get("selector") for action in actions if action.get("type") == "click"}
+    for action in actions:
+        if action.get("type") == "fill" and action.get("selector") in clicked:
+            raise ValueError(f"Cannot click and fill {action['selector']!r} in the same action group")
+
+
+class Workflow:
     """
-    💜 Abstract base class for Purple Guardian workflows
+    💜 Base class for Purple Guardian workflows
     
     All workflows must inherit from this class and implement the execute method.
     """
 
+    __slots__ = ("_name", "_str", "_repr", "state", "metadata")
+
     def __init__(self, name: Optional[str] = None):
         self.name = name or self.__class__.__name__
-        self.state: Dict[str, Any] = {}
-        self.metadata: Dict[str, Any] = {}
+        # Allocated on first write; many workflows never use them
+        self.state: Optional[Dict[str, Any]] = None
+        self.metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        # str()/repr() are built once per name; workflows are logged often
+        self._name = name
+        self._str = f"💜 {name}"
+        self._repr = f"Workflow(name='{name}')"
 
-    @abstractmethod
     async def execute(self, page: Page) -> Any:
         """
         Execute the workflow logic
@@ -30,7 +217,45 @@ class Workflow(ABC):
         Returns:
             Any result from the workflow execution
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement execute()")
+
+    async def acquire_page(self, context: BrowserContext) -> Page:
+        """Borrow a page of the context, reusing one from an earlier run when possible"""
+        return await _page_pool(context).acquire()
+
+    async def release_page(self, page: Page, reuse: bool = True):
+        """
+        Give back a page from acquire_page, or close it
+        
+        A reused page has the context's cookies and its current origin's
+        local/session storage cleared. Storage and IndexedDB of other
+        origins visited during the run are kept, so reused pages are not
+        isolated from earlier runs on the same context. The page is then
+        parked on about:blank so the old document's timers, requests and
+        listeners can't raise events into the next run's monitor. Pages
+        that are closed, crashed or fail to clear or unload are closed
+        instead of reused.
+        """
+        pool = _PAGE_POOLS.get(id(page.context))
+        reuse = reuse and pool is not None and not page.is_closed()
+        if reuse:
+            cleared = await asyncio.gather(
+                page.context.clear_cookies(), page.evaluate(_CLEAR_STORAGE_JS), return_exceptions=True
+            )
+            reuse = not any(isinstance(outcome, Exception) for outcome in cleared)
+        if reuse:
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                reuse = False
+        
+        try:
+            if pool is not None:
+                await pool.release(page, reuse=reuse)
+            elif not page.is_closed():
+                await page.close()
+        except Exception:
+            pass  # Already crashed or closed; nothing left to clean up
 
     async def before_execute(self, page: Page):
         """Hook called before workflow execution"""
@@ -46,25 +271,33 @@ class Workflow(ABC):
 
     def set_state(self, key: str, value: Any):
         """Set workflow state"""
+        if self.state is None:
+            self.state = {}
         self.state[key] = value
 
     def get_state(self, key: str, default: Any = None) -> Any:
         """Get workflow state"""
+        if self.state is None:
+            return default
         return self.state.get(key, default)
 
     def set_metadata(self, key: str, value: Any):
         """Set workflow metadata"""
+        if self.metadata is None:
+            self.metadata = {}
         self.metadata[key] = value
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get workflow metadata"""
+        if self.metadata is None:
+            return default
         return self.metadata.get(key, default)
 
     def __str__(self) -> str:
-        return f"💜 {self.name}"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"Workflow(name='{self.name}')"
+        return self._repr
 
 
 class BasicWorkflow(Workflow):
@@ -72,57 +305,206 @@ class BasicWorkflow(Workflow):
     💜 Basic workflow implementation for simple automation tasks
     """
 
-    def __init__(self, url: str, actions: list = None, name: Optional[str] = None):
+    __slots__ = ("url", "verbose", "wait_until", "_pending_io", "_actions", "_compiled", "_plan", "_locators")
+
+    def __init__(
+        self,
+        url: str,
+        actions: list = None,
+        name: Optional[str] = None,
+        verbose: bool = False,
+        wait_until: str = "load"
+    ):
         super().__init__(name)
         self.url = url
+        # Load state page.goto waits for before the actions run
+        self.wait_until = wait_until
+        # Collect per-action results only when asked for
+        self.verbose = verbose
+        # Selectors repeated across actions share one locator per page
+        self._locators = _Locators()
+        # Screenshots still being written; the run waits for them at the end
+        self._pending_io: List["asyncio.Task[Any]"] = []
+        # The actions the plan was compiled from, to notice later changes
+        self._compiled: tuple = ()
+        self._plan: List[_Step] = []
         self.actions = actions or []
+        self._compile()
+
+    @property
+    def actions(self) -> list:
+        """
+        Workflow actions, compiled into a plan
+        
+        The plan is recompiled when actions are added, removed or replaced,
+        in place or by assigning a new list. Edits inside an action dict
+        are not seen; replace the dict instead.
+        """
+        return self._actions
+
+    @actions.setter
+    def actions(self, actions: list):
+        self._actions = actions
+
+    def _plan_is_stale(self) -> bool:
+        """Whether the actions changed since the plan was compiled"""
+        compiled, actions = self._compiled, self._actions
+        return len(compiled) != len(actions) or any(
+            action is not seen for action, seen in zip(actions, compiled)
+        )
 
     async def execute(self, page: Page) -> Dict[str, Any]:
         """Execute basic workflow with URL navigation and actions"""
-        await page.goto(self.url)
+        if self._plan_is_stale():
+            self._compile()
         
-        results = []
-        for action in self.actions:
-            if callable(action):
-                result = await action(page)
-                results.append(result)
-            elif isinstance(action, dict):
-                result = await self._execute_action(page, action)
-                results.append(result)
+        await page.goto(self.url, wait_until=self.wait_until)
+        
+        results = [] if self.verbose else None
+        try:
+            for step in self._plan:
+                step_results = await step(page)
+                if results is not None:
+                    results.extend(step_results)
+        except BaseException:
+            await self._drain_io(return_exceptions=True)
+            raise
+        await self._drain_io()
         
         return {
             "url": self.url,
-            "actions_executed": len(self.actions),
+            "actions_executed": len(self._compiled),
             "results": results
         }
 
+    async def _drain_io(self, return_exceptions: bool = False):
+        """Wait for the screenshots started during the run"""
+        # Compiled screenshot steps hold on to this list, so empty it in place
+        pending = list(self._pending_io)
+        self._pending_io.clear()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=return_exceptions)
+
+    def _compile(self):
+        """Compile the actions into a plan; invalid actions raise here"""
+        plan = []
+        # Consecutive actions sharing a "group" id are independent and run
+        # concurrently; groups and ungrouped actions still run in order
+        for group, run in groupby(self._actions, key=_action_group):
+            run = list(run)
+            if group is not None and len(run) > 1:
+                _check_group(run)
+                plan.append(_concurrent_step([self._compile_action(action) for action in run]))
+            else:
+                plan.extend(self._compile_sequence(run))
+        
+        self._plan = plan
+        self._compiled = tuple(self._actions)
+
+    def _compile_sequence(self, actions: List[Any]) -> List[_Step]:
+        """Compile actions that run one after another"""
+        steps = []
+        run: List[Dict[str, Any]] = []
+        
+        def flush():
+            # Consecutive fills, and the click that may end them, are
+            # applied together
+            if len(run) > 1:
+                steps.append(_ops_step(list(run), self._locators))
+            elif run:
+                steps.append(_single_step(self._compile_action(run[0])))
+            run.clear()
+        
+        for action in actions:
+            kind = _fusible_kind(action)
+            if kind is not None:
+                run.append(action)
+                # A click may navigate, so nothing is fused past it
+                if kind == "click":
+                    flush()
+                continue
+            
+            flush()
+            if callable(action):
+                steps.append(_single_step(action))
+            elif isinstance(action, dict):
+                steps.append(_single_step(self._compile_action(action)))
+        
+        flush()
+        return steps
+
+    def _compile_action(self, action: Dict[str, Any]) -> Callable[[Page], Awaitable[Any]]:
+        """Compile a single action defined as dictionary"""
+        action_type = action.get("type")
+        compiler = self._COMPILERS.get(action_type)
+        if compiler is None:
+            raise ValueError(f"Unknown action type: {action_type}")
+        return compiler(self, action)
+
     async def _execute_action(self, page: Page, action: Dict[str, Any]):
         """Execute a single action defined as dictionary"""
-        action_type = action.get("type")
+        return await self._compile_action(action)(page)
+
+    def _compile_click(self, action: Dict[str, Any]):
+        selector = action["selector"]
+        message = f"Clicked: {selector}"
+        locators = self._locators
         
-        if action_type == "click":
-            await page.click(action["selector"])
-            return f"Clicked: {action['selector']}"
+        async def click(page: Page):
+            await locators(page, selector).click()
+            return message
+        return click
+
+    def _compile_fill(self, action: Dict[str, Any]):
+        selector, value = action["selector"], action["value"]
+        message = f"Filled: {selector} = {value}"
+        locators = self._locators
         
-        elif action_type == "fill":
-            await page.fill(action["selector"], action["value"])
-            return f"Filled: {action['selector']} = {action['value']}"
+        async def fill(page: Page):
+            await locators(page, selector).fill(value)
+            return message
+        return fill
+
+    def _compile_wait(self, action: Dict[str, Any]):
+        selector = action.get("selector")
+        timeout = action.get("timeout")
         
-        elif action_type == "wait":
-            if "selector" in action:
-                await page.wait_for_selector(action["selector"])
-                return f"Waited for: {action['selector']}"
-            elif "timeout" in action:
-                await page.wait_for_timeout(action["timeout"])
-                return f"Waited: {action['timeout']}ms"
+        async def wait(page: Page):
+            if selector is not None:
+                await page.wait_for_selector(selector)
+                return f"Waited for: {selector}"
+            if timeout is not None:
+                await page.wait_for_timeout(timeout)
+                return f"Waited: {timeout}ms"
+        return wait
+
+    def _compile_screenshot(self, action: Dict[str, Any]):
+        path = action.get("path", "screenshot.png")
+        message = f"Screenshot saved: {path}"
         
-        elif action_type == "screenshot":
-            path = action.get("path", "screenshot.png")
-            await page.screenshot(path=path)
-            return f"Screenshot saved: {path}"
+        # Blocking by default: the image is evidence of this step's state
+        if not action.get("async", False):
+            async def screenshot(page: Page):
+                await page.screenshot(path=path)
+                return message
+            return screenshot
         
-        else:
-            raise ValueError(f"Unknown action type: {action_type}")
+        pending_io = self._pending_io
+        
+        async def screenshot_async(page: Page):
+            # The capture runs alongside the next actions and may show their
+            # effects; yielding once at least sends its request first
+            pending_io.append(asyncio.ensure_future(page.screenshot(path=path)))
+            await asyncio.sleep(0)
+            return message
+        return screenshot_async
+
+    _COMPILERS = {
+        "click": _compile_click,
+        "fill": _compile_fill,
+        "wait": _compile_wait,
+        "screenshot": _compile_screenshot
+    }
 
 
 class FormWorkflow(Workflow):
@@ -130,30 +512,68 @@ class FormWorkflow(Workflow):
     💜 Specialized workflow for form interactions
     """
 
-    def __init__(self, url: str, form_data: Dict[str, str], submit_selector: str = "button[type='submit']", name: Optional[str] = None):
+    __slots__ = (
+        "url", "form_data", "submit_selector", "keyboard_fields", "post_submit_timeout", "verbose", "_locators"
+    )
+
+    def __init__(
+        self,
+        url: str,
+        form_data: Dict[str, str],
+        submit_selector: str = "button[type='submit']",
+        name: Optional[str] = None,
+        keyboard_fields: Optional[Iterable[str]] = None,
+        post_submit_timeout: float = 2.0,
+        verbose: bool = False
+    ):
         super().__init__(name)
         self.url = url
         self.form_data = form_data
         self.submit_selector = submit_selector
+        # Fields that need real keyboard input are always filled through Playwright
+        self.keyboard_fields = set(keyboard_fields or ())
+        # Longest wait (seconds) for the submit to navigate or settle
+        self.post_submit_timeout = post_submit_timeout
+        # List each filled field in the result only when asked for
+        self.verbose = verbose
+        # Reused across repeated runs on the same page
+        self._locators = _Locators()
 
     async def execute(self, page: Page) -> Dict[str, Any]:
         """Execute form workflow"""
         await page.goto(self.url)
         
-        # Fill form fields
-        filled_fields = []
+        # Fill form fields, all at once where possible
+        batched = [
+            ["fill", selector, value] for selector, value in self.form_data.items()
+            if selector not in self.keyboard_fields
+        ]
+        await _apply_ops(page, batched, self._locators)
         for selector, value in self.form_data.items():
-            await page.fill(selector, value)
-            filled_fields.append(f"{selector} = {value}")
+            if selector in self.keyboard_fields:
+                await self._locators(page, selector).fill(value)
         
-        # Submit form
-        await page.click(self.submit_selector)
+        filled_fields = None
+        if self.verbose:
+            filled_fields = [f"{selector} = {value}" for selector, value in self.form_data.items()]
         
-        # Wait for navigation or response
+        # Submit form; the navigation listener is attached first so a fast
+        # navigation is not missed. Only the main frame counts: ad and
+        # analytics iframes navigate on their own
+        timeout_ms = self.post_submit_timeout * 1000
+        main_frame = page.main_frame
+        navigated = asyncio.ensure_future(page.wait_for_event(
+            "framenavigated", predicate=lambda frame: frame == main_frame, timeout=timeout_ms
+        ))
         try:
-            await page.wait_for_load_state("networkidle", timeout=5000)
-        except:
-            pass  # Continue if no navigation occurs
+            await self._locators(page, self.submit_selector).click()
+        except BaseException:
+            navigated.cancel()
+            raise
+        
+        # Wait for navigation or response, whichever comes first
+        settled = asyncio.ensure_future(page.wait_for_load_state("networkidle", timeout=timeout_ms))
+        await self._wait_first(navigated, settled)
         
         return {
             "url": self.url,
@@ -163,31 +583,78 @@ class FormWorkflow(Workflow):
             "final_url": page.url
         }
 
+    async def _wait_first(self, *waiters: "asyncio.Future[Any]"):
+        """Wait until the first waiter finishes or the timeout passes; cancel the rest"""
+        done, pending = await asyncio.wait(
+            waiters, timeout=self.post_submit_timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        for waiter in pending:
+            waiter.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Every outcome is retrieved before raising so none goes unreported
+        errors = [waiter.exception() for waiter in done]
+        for error in errors:
+            # Continue if no navigation occurs; anything else is a real failure
+            if error is not None and not isinstance(error, PWTimeout):
+                raise error
+
 
 class NavigationWorkflow(Workflow):
     """
     💜 Workflow for complex navigation patterns
     """
 
-    def __init__(self, navigation_steps: list, name: Optional[str] = None):
+    __slots__ = ("navigation_steps", "context", "pool_size", "wait_until", "prefetch")
+
+    def __init__(
+        self,
+        navigation_steps: list,
+        name: Optional[str] = None,
+        context: Optional[BrowserContext] = None,
+        pool_size: int = 1,
+        wait_until: str = "domcontentloaded",
+        prefetch: bool = False
+    ):
         super().__init__(name)
         self.navigation_steps = navigation_steps
+        # Intermediate steps only need to reach their URL; the last step
+        # always waits for "load". Step dicts may set their own "wait_until"
+        self.wait_until = wait_until
+        # Open the leading plain URL steps together before walking them
+        self.prefetch = prefetch
+        # Plain URL steps are independent and may load on up to pool_size
+        # extra, unmonitored pages of the context (the page's own context
+        # by default)
+        self.context = context
+        self.pool_size = pool_size
 
     async def execute(self, page: Page) -> Dict[str, Any]:
         """Execute navigation workflow"""
-        visited_urls = []
+        steps = self.navigation_steps
+        if self.pool_size > 1 and len(steps) > 1 and all(isinstance(step, str) for step in steps):
+            return await self._execute_pooled(page)
         
-        for step in self.navigation_steps:
+        if self.prefetch:
+            await self._prefetch_prefix(page)
+        
+        # One slot per step; steps that visit nothing leave theirs empty
+        visited_urls: List[Optional[str]] = [None] * len(steps)
+        last = len(steps) - 1
+        
+        for index, step in enumerate(steps):
+            wait_until = "load" if index == last else self.wait_until
+            
             if isinstance(step, str):
                 # Simple URL navigation
-                await page.goto(step)
-                visited_urls.append(step)
+                await page.goto(step, wait_until=wait_until)
+                visited_urls[index] = step
             
             elif isinstance(step, dict):
                 # Complex navigation step
                 if step.get("type") == "goto":
-                    await page.goto(step["url"])
-                    visited_urls.append(step["url"])
+                    await page.goto(step["url"], wait_until=step.get("wait_until", wait_until))
+                    visited_urls[index] = step["url"]
                 
                 elif step.get("type") == "click_and_wait":
                     await page.click(step["selector"])
@@ -195,10 +662,54 @@ class NavigationWorkflow(Workflow):
                         await page.wait_for_selector(step["wait_for"])
                     else:
                         await page.wait_for_load_state("networkidle")
-                    visited_urls.append(page.url)
+                    visited_urls[index] = page.url
+        
+        if None in visited_urls:
+            visited_urls = [url for url in visited_urls if url is not None]
         
         return {
             "steps_executed": len(self.navigation_steps),
             "urls_visited": visited_urls,
             "final_url": page.url
+        }
+
+    async def _prefetch_prefix(self, page: Page):
+        """Hit the leading URL-only steps concurrently so the serial walk finds warm connections"""
+        prefix = []
+        for step in self.navigation_steps:
+            if not isinstance(step, str):
+                break
+            prefix.append(step)
+        
+        if len(prefix) > 1:
+            context = self.context or page.context
+            # Best effort: the serial walk reports any real failure
+            await asyncio.gather(*(_prefetch(context, url) for url in prefix), return_exceptions=True)
+
+    async def _execute_pooled(self, page: Page) -> Dict[str, Any]:
+        """
+        Load URL-only steps concurrently on pooled pages
+        
+        Only the last URL loads on the monitored workflow page. The pooled
+        pages carry no StrictMonitor listeners, so console errors, page
+        errors and requests of the other URLs are not recorded.
+        """
+        *others, last = self.navigation_steps
+        pool = PagePool(self.context or page.context, size=self.pool_size)
+        
+        async def visit(url: str):
+            async with pool.page() as pooled:
+                await pooled.goto(url, wait_until=self.wait_until)
+        
+        # The last URL loads on the workflow page itself so that monitoring
+        # and the final state reflect it, as in the serial path
+        try:
+            await asyncio.gather(page.goto(last, wait_until="load"), *(visit(url) for url in others))
+        finally:
+            await pool.close()
+        
+        return {
+            "steps_executed": len(self.navigation_steps),
+            "urls_visited": list(self.navigation_steps),
+            "final_url": page.url
         }
\ No newline at end of file
@@ -4,13 +4,16 @@
 
 import pytest
 import asyncio
+import logging
 from unittest.mock import AsyncMock, MagicMock
 
 # Note: These imports will work after the package is installed
 try:
     from purple_guardian import PurpleGuardian, Workflow, PurpleConfig
     from purple_guardian.monitors import StrictMonitor
+    from purple_guardian.detectors import ViolationDetector
     from purple_guardian.strategies import RestartStrategy
+    from purple_guardian.workflows import BasicWorkflow, FormWorkflow, NavigationWorkflow
 except ImportError:
     # Skip tests if package not installed
     pytest.skip("purple_guardian not installed", allow_module_level=True)
@@ -47,27 +50,294 @@ def guardian(config):
     return PurpleGuardian(config=config)
 
 
+def mock_locators(page):
+    """Give a mocked page locators that record their calls as (selector, action, *args)"""
+    calls = []
+    
+    def locator(selector):
+        loc = MagicMock()
+        for action in ("click", "fill"):
+            loc.first.attach_mock(AsyncMock(
+                side_effect=lambda *args, action=action: calls.append((selector, action) + args)
+            ), action)
+        return loc
+    
+    page.locator = MagicMock(side_effect=locator)
+    return calls
+
+
+class _StubPage:
+    """Just enough of a Playwright page for a guardian attempt"""
+    
+    url = "about:blank"
+    
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.storage_cleared = 0
+        self.unloaded = 0
+        self.handlers = {}
+    
+    def is_closed(self):
+        return self.closed
+    
+    def set_default_timeout(self, timeout):
+        pass
+    
+    async def evaluate(self, script):
+        self.storage_cleared += 1
+    
+    async def goto(self, url):
+        self.unloaded += 1
+    
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+    
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+    
+    def emit(self, event, payload):
+        for handler in list(self.handlers.get(event, ())):
+            handler(payload)
+    
+    async def add_init_script(self, script):
+        pass
+    
+    async def close(self):
+        self.closed = True
+
+
+class _StubContext:
+    """Browser context handing out stub pages"""
+    
+    def __init__(self, browser=None):
+        self.browser = browser
+        self.closed = False
+        self.pages = []
+        self._on_close = []
+    
+    def on(self, event, handler):
+        self._on_close.append(handler)
+    
+    async def new_page(self):
+        page = _StubPage(self)
+        self.pages.append(page)
+        return page
+    
+    async def clear_cookies(self):
+        pass
+    
+    async def close(self):
+        self.closed = True
+        for handler in self._on_close:
+            handler(self)
+
+
+class _StubMonitor:
+    """Monitor/detector stand-in that never reports violations"""
+    
+    async def setup(self, page):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def clone(self):
+        return self
+    
+    async def get_violations_async(self):
+        return []
+
+
+async def _new_stub_context():
+    return _StubContext()
+
+
+def mock_context_pool(guardian):
+    """Replace browser launch with a single stub context in the pool"""
+    guardian._entered = True  # keep the pool between runs, as under `async with`
+    guardian._setup_browser = AsyncMock()
+    guardian._new_context = _new_stub_context
+    guardian._ctx_pool = asyncio.Queue()
+    guardian._ctx_pool.put_nowait(_StubContext())
+
+
+@pytest.fixture
+def stubbed_guardian(guardian):
+    """Guardian with a stub context pool and violation-free monitor and detector"""
+    mock_context_pool(guardian)
+    guardian.monitor = _StubMonitor()
+    guardian.violation_detector = _StubMonitor()
+    return guardian
+
+
 @pytest.mark.asyncio
-async def test_successful_workflow(guardian):
+async def test_successful_workflow(stubbed_guardian):
     """Test successful workflow execution"""
+    guardian = stubbed_guardian
     workflow = TestWorkflow(should_fail=False)
     
-    # Mock browser setup
-    guardian._setup_browser = AsyncMock()
-    guardian._cleanup_browser = AsyncMock()
-    guardian.page = MagicMock()
-    guardian.monitor = MagicMock()
-    guardian.monitor.setup = AsyncMock()
-    guardian.monitor.has_violations = MagicMock(return_value=False)
-    guardian.violation_detector = MagicMock()
-    guardian.violation_detector.setup = AsyncMock()
-    guardian.violation_detector.has_violations = MagicMock(return_value=False)
-    
     result = await guardian.run(workflow)
     
     assert result["status"] == "success"
     assert workflow.executed
-    assert guardian.stats["successful_executions"] == 1
+    assert guardian.get_stats()["successful_executions"] == 1
+    assert guardian._ctx_pool.qsize() == 1  # context returned to the pool
+
+
+@pytest.mark.asyncio
+async def test_guardian_reuses_pages_across_runs(stubbed_guardian):
+    """Test later runs on a context get the earlier page back, cleared"""
+    guardian = stubbed_guardian
+    context = guardian._ctx_pool._queue[0]
+    
+    await guardian.run(TestWorkflow())
+    await guardian.run(TestWorkflow())
+    
+    assert len(context.pages) == 1
+    assert context.pages[0].storage_cleared == context.pages[0].unloaded == 2
+    assert not context.pages[0].closed
+    
+    # A page whose old document can't be unloaded is not pooled either
+    async def stuck(url):
+        raise Exception("Navigation timeout")
+    context.pages[0].goto = stuck
+    await guardian.run(TestWorkflow())
+    assert context.pages[0].closed
+    await guardian.run(TestWorkflow())
+    
+    # A page that cannot be cleared is closed, not pooled, and the run still passes
+    async def crashed(script):
+        raise Exception("Target crashed")
+    context.pages[1].evaluate = crashed
+    assert (await guardian.run(TestWorkflow()))["attempt"] == 1
+    assert context.pages[1].closed
+    
+    class ClosingWorkflow(Workflow):
+        async def execute(self, page):
+            await page.close()
+            return {}
+    
+    assert (await guardian.run(ClosingWorkflow()))["attempt"] == 1
+    assert len(context.pages) == 3 and context.pages[2].storage_cleared == 0
+    
+    # Failed runs close their page along with the context
+    guardian.max_retries = 0
+    with pytest.raises(Exception):
+        await guardian.run(TestWorkflow(should_fail=True))
+    assert context.pages[3].closed and context.closed
+
+
+@pytest.mark.asyncio
+async def test_run_without_async_with_closes_browser(stubbed_guardian):
+    """Test a guardian not used as a context manager shuts down after the run"""
+    guardian = stubbed_guardian
+    guardian._entered = False
+    context = guardian._ctx_pool._queue[0]
+    
+    result = await guardian.run(TestWorkflow())
+    
+    assert result["status"] == "success"
+    assert context.closed
+    assert guardian._ctx_pool is None
+
+
+class _PageErrorWorkflow(Workflow):
+    """Workflow whose page throws an error and then keeps running for a while"""
+    
+    async def execute(self, page):
+        page.emit("pageerror", Exception("boom"))
+        await asyncio.sleep(0.01)
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_keep_their_own_violations(stubbed_guardian):
+    """Test a run starting alongside another cannot clear the other's violations"""
+    guardian = stubbed_guardian
+    guardian.max_retries = 0
+    guardian.monitor = StrictMonitor()
+    guardian._ctx_pool.put_nowait(_StubContext())
+    
+    failing, passing = await asyncio.gather(
+        guardian.run(_PageErrorWorkflow()),
+        guardian.run(TestWorkflow()),
+        return_exceptions=True
+    )
+    
+    assert "boom" in str(failing)
+    assert passing["status"] == "success"
+    assert not guardian._watchers_busy
+
+
+class _HangingWorkflow(Workflow):
+    """Workflow that never finishes"""
+    
+    async def execute(self, page):
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_returns_its_context_slot(stubbed_guardian):
+    """Test a timed-out run frees its context slot for the next run"""
+    guardian = stubbed_guardian
+    context = guardian._ctx_pool._queue[0]
+    
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(guardian.run(_HangingWorkflow()), timeout=0.01)
+    
+    assert context.closed
+    assert guardian._ctx_pool.qsize() == 1
+    
+    result = await asyncio.wait_for(guardian.run(TestWorkflow()), timeout=1)
+    assert result["status"] == "success"
+
+
+class _StubBrowser:
+    """Browser that can crash; new contexts then fail to open"""
+    
+    def __init__(self):
+        self.connected = True
+    
+    def is_connected(self):
+        return self.connected
+    
+    async def new_context(self, **options):
+        if not self.connected:
+            raise Exception("Browser has been closed")
+        return _StubContext(self)
+    
+    async def close(self):
+        self.connected = False
+
+
+@pytest.mark.asyncio
+async def test_crashed_browser_is_relaunched(guardian):
+    """Test a run survives the browser crashing between attempts"""
+    crashed = _StubBrowser()
+    guardian.browser = crashed
+    guardian._entered = True
+    guardian._playwright = MagicMock()
+    guardian._playwright.chromium.launch = AsyncMock(side_effect=lambda **options: _StubBrowser())
+    guardian._ctx_pool = asyncio.Queue()
+    guardian._ctx_pool.put_nowait(_StubContext(crashed))
+    guardian.monitor = _StubMonitor()
+    guardian.violation_detector = _StubMonitor()
+    guardian.restart_strategy = RestartStrategy.create_immediate()
+    
+    class CrashingWorkflow(Workflow):
+        async def execute(self, page):
+            if guardian.browser is crashed:
+                crashed.connected = False
+                raise Exception("Target crashed")
+            return {}
+    
+    result = await guardian.run(CrashingWorkflow())
+    
+    assert result["attempt"] == 2
+    assert guardian._playwright.chromium.launch.await_count == 1
+    assert guardian._ctx_pool.qsize() == 1
+    assert guardian._ctx_pool._queue[0].browser is guardian.browser
 
 
 @pytest.mark.asyncio
@@ -77,15 +347,20 @@ async def test_workflow_with_retries(guardian):
     workflow = TestWorkflow(should_fail=True)
     
     # Mock browser setup
-    guardian._setup_browser = AsyncMock()
-    guardian._cleanup_browser = AsyncMock()
-    guardian._handle_restart = AsyncMock()
+    mock_context_pool(guardian)
+    
+    async def restart_without_delay(attempt, context):
+        await guardian._close_context(context)
+    
+    guardian._handle_restart = AsyncMock(side_effect=restart_without_delay)
     
     with pytest.raises(Exception):
         await guardian.run(workflow)
     
-    assert guardian.stats["restart_count"] == 1
-    assert guardian.stats["violations_detected"] == 2  # Initial + 1 retry
+    stats = guardian.get_stats()
+    assert stats["restart_count"] == 1
+    assert stats["violations_detected"] == 2  # Initial + 1 retry
+    assert guardian._ctx_pool.qsize() == 1  # dirty contexts replaced
 
 
 def test_config_validation():
@@ -100,16 +375,74 @@ def test_config_validation():
     
     with pytest.raises(ValueError):
         PurpleConfig(default_timeout=500)  # Too low
+    
+    # Updates are validated and rejected values are not applied
+    with pytest.raises(ValueError):
+        config.update(viewport={"width": 50, "height": 50})
+    assert config.viewport == {"width": 1920, "height": 1080}
+
+
+def test_config_options_follow_update(config):
+    """Test cached Playwright options are rebuilt on update"""
+    assert config.get_browser_launch_options()["headless"] is True
+    
+    config.update(headless=False, viewport={"width": 800, "height": 600})
+    
+    assert config.get_browser_launch_options()["headless"] is False
+    assert config.get_browser_context_options()["viewport"] == {"width": 800, "height": 600}
+    
+    # Plain attribute assignment is honoured too
+    config.headless = True
+    config.user_agent = "X"
+    assert config.get_browser_launch_options()["headless"] is True
+    assert config.get_browser_context_options()["user_agent"] == "X"
+
+
+def test_config_merge():
+    """Test merging keeps the other config's values and both custom settings"""
+    base = PurpleConfig(screenshot_on_violation=False, custom_settings={"a": 1})
+    other = PurpleConfig(
+        screenshot_on_violation=False,
+        max_retries=5,
+        custom_settings={"b": 2}
+    )
+    
+    merged = base.merge(other)
+    
+    assert merged.max_retries == 5
+    assert merged.custom_settings == {"a": 1, "b": 2}
+
+
+def test_config_file_roundtrip(tmp_path, config):
+    """Test saving and loading configuration files"""
+    config_path = tmp_path / "config.json"
+    config.update(max_retries=4)
+    
+    config.save_to_file(str(config_path))
+    loaded = PurpleConfig.from_file(str(config_path))
+    
+    assert loaded.max_retries == 4
+    
+    with pytest.raises(ValueError):
+        config.save_to_file(str(tmp_path / "config.txt"))
+    assert not (tmp_path / "config.txt").exists()
 
 
 def test_restart_strategy():
     """Test restart strategy calculations"""
     strategy = RestartStrategy.create_exponential(base_delay=1.0, backoff_factor=2.0)
+    strategy.jitter = False
     
     # Test delay calculations
     assert strategy.get_delay(0) >= 1.0
     assert strategy.get_delay(1) >= 2.0
     assert strategy.get_delay(2) >= 4.0
+    assert strategy.get_delay(5000) == strategy.max_delay
+    
+    # Raising the cap directly moves the clamp with it
+    strategy.max_delay = 300.0
+    assert strategy.get_delay(7) == 128.0
+    assert strategy.get_delay(5000) == 300.0
 
 
 def test_config_from_env(monkeypatch):
@@ -136,6 +469,476 @@ async def test_monitor_setup():
     
     assert monitor.is_monitoring
     assert monitor.page == page
+    
+    # Stopping keeps what was recorded and lets go of the page and event task
+    monitor._on_page_error("boom")
+    monitor.stop()
+    
+    assert not monitor.is_monitoring
+    assert monitor._event_task is None
+    assert page.remove_listener.call_count == page.on.call_count == 4
+    assert len(monitor.get_violations()) == 1
+
+
+@pytest.mark.asyncio
+async def test_monitor_coalesces_console_errors():
+    """Test repeated console errors are recorded once per message with a count"""
+    monitor = StrictMonitor()
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    await monitor.setup(page)
+    
+    for text in ("boom", "boom", "boom", "other"):
+        monitor._on_console(MagicMock(type="error", text=text))
+    monitor._on_console(MagicMock(type="log", text="fine"))
+    
+    violations = monitor.get_violations()
+    counts = {v["details"]["message"]: v["details"]["count"] for v in violations}
+    
+    assert counts == {"boom": 3, "other": 1}
+    assert len(monitor.get_console_messages()) == 5
+    
+    monitor.reset()
+
+
+@pytest.mark.asyncio
+async def test_monitor_resolves_playwright_selectors_individually():
+    """Test selectors the DOM can't parse fall back to Playwright's engine"""
+    monitor = StrictMonitor()
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    await monitor.setup(page)
+    
+    page.evaluate = AsyncMock(return_value=[True, None, False])
+    page.query_selector = AsyncMock(return_value=None)
+    
+    await monitor.check_expected_elements(["#ok", "text=Welcome", "#missing"])
+    
+    page.query_selector.assert_awaited_once_with("text=Welcome")
+    missing = [v["details"]["selector"] for v in monitor.get_violations()]
+    assert missing == ["text=Welcome", "#missing"]
+    
+    monitor.reset()
+
+
+@pytest.mark.asyncio
+async def test_detector_reuses_scan_of_unchanged_page():
+    """Test detection is skipped while the DOM and URL are unchanged"""
+    detector = ViolationDetector()
+    scans = []
+    page_seq = [1]
+    page_doc = ["doc-1"]
+    
+    async def evaluate(script, arg=None):
+        if "images" in script:
+            scans.append(script)
+            return {"ready": "complete", "broken": 0, "seq": page_seq[0], "doc": page_doc[0]}
+        if "__pgSeq" in script:
+            return [1, page_doc[0], "https://example.com/", "complete"]
+        scans.append(script)
+        return []
+    
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    page.evaluate = AsyncMock(side_effect=evaluate)
+    await detector.setup(page)
+    
+    await detector.detect_violations()
+    scans_per_detection = len(scans)
+    await detector.detect_violations()
+    
+    assert scans_per_detection > 0
+    assert len(scans) == scans_per_detection
+    
+    detector.add_unexpected_selector(".boom")
+    await detector.detect_violations()
+    assert len(scans) == 2 * scans_per_detection
+    
+    # A scan that saw the DOM mutate underneath it is not reused
+    page_seq[0] = 2
+    detector.add_unexpected_selector(".bang")
+    await detector.detect_violations()
+    await detector.detect_violations()
+    assert len(scans) == 4 * scans_per_detection
+    
+    # A reload of the same URL that reaches the same sequence is a new document
+    page_seq[0] = 1
+    await detector.detect_violations()
+    scans_before_reload = len(scans)
+    page_doc[0] = "doc-2"
+    await detector.detect_violations()
+    assert len(scans) == scans_before_reload + scans_per_detection
+
+
+@pytest.mark.asyncio
+async def test_detector_returns_violation_dicts():
+    """Test violations are stored compactly but exposed as dicts"""
+    detector = ViolationDetector()
+    
+    async def evaluate(script, arg=None):
+        if "images" in script:
+            return {"ready": "complete", "broken": 0, "seq": None}
+        if "__pgSeq" in script:
+            return [None, "https://example.com/", "complete"]
+        if "tag_name" in script:
+            return [{"selector": ".error", "tag_name": "div", "text": "boom"}]
+        return []
+    
+    async def validator(page):
+        return {"type": "custom", "detail": 1}
+    
+    async def broken_validator(page):
+        raise RuntimeError("boom")
+    
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    page.evaluate = AsyncMock(side_effect=evaluate)
+    await detector.setup(page)
+    detector.add_custom_validator(validator)
+    detector.add_custom_validator(broken_validator)
+    
+    found = await detector.detect_violations()
+    
+    assert {"type": "custom", "detail": 1} in found
+    error = next(v for v in found if v["type"] == "custom_validator_error")
+    assert error["validator"] == "broken_validator"
+    unexpected = next(v for v in found if v["type"] == "unexpected_element")
+    assert unexpected["selector"] == ".error"
+    assert unexpected["tag_name"] == "div"
+    assert "timestamp" in unexpected
+    assert list(detector.get_violations()) == found
+    assert detector.get_violations() is detector.get_violations()
+    assert detector.get_violation_summary()["violation_types"] == {
+        "unexpected_element": 1,
+        "custom": 1,
+        "custom_validator_error": 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_detector_skips_empty_rule_sets():
+    """Test checks without rules make no page round-trips"""
+    detector = ViolationDetector()
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    page.evaluate = AsyncMock(return_value={"ready": "complete", "broken": 0, "seq": None})
+    await detector.setup(page)
+    detector.clear_rules()
+    
+    page.evaluate.reset_mock()
+    await detector.detect_violations()
+    
+    # Only the scan probe and the page state check remain
+    assert page.evaluate.await_count == 2
+
+
+def test_detector_history_is_bounded(monkeypatch):
+    """Test only the most recent violations are kept, with counts to match"""
+    from purple_guardian import detectors
+    from purple_guardian.detectors import Violation
+    
+    monkeypatch.setattr(detectors, "_HISTORY_LIMIT", 3)
+    detector = ViolationDetector()
+    detector.logger.setLevel(logging.ERROR)
+    for violation_type in ("old", "new", "new", "new"):
+        detector._record_violation(Violation(violation_type))
+    
+    assert [v.type for v in detector.detection_history] == ["new", "new", "new"]
+    assert detector.get_violation_summary()["violation_types"] == {"new": 3}
+
+
+def test_guardian_logging_handler_attached_once(config):
+    """Test repeated guardians do not duplicate log handlers"""
+    first = PurpleGuardian(config=config)
+    PurpleGuardian(config=config)
+    
+    stream_handlers = [h for h in first.logger.handlers if type(h) is logging.StreamHandler]
+    assert len(stream_handlers) == 1
+    
+    # A guardian with its own format leaves the first one's output alone
+    custom_config = config.copy()
+    custom_config.update(log_format="%(message)s")
+    custom = PurpleGuardian(config=custom_config)
+    record = logging.LogRecord("PurpleGuardian", logging.INFO, __file__, 0, "hello", None, None)
+    
+    assert custom.logger.handlers[0].format(record) == "hello"
+    assert first.logger.handlers[0].format(record).startswith("💜 ")
+
+
+@pytest.mark.asyncio
+async def test_form_workflow_batches_fills():
+    """Test form fields are filled in one evaluate with page.fill fallbacks"""
+    page = MagicMock()
+    page.url = "https://example.com/done"
+    page.goto = AsyncMock()
+    calls = mock_locators(page)
+    page.wait_for_load_state = AsyncMock()
+    page.wait_for_event = AsyncMock()
+    page.evaluate = AsyncMock(return_value=[1])  # "#b" could not be set in-page
+    
+    workflow = FormWorkflow(
+        "https://example.com",
+        {"#a": "1", "#b": "2", "#c": "3", "#pin": "4"},
+        keyboard_fields=["#pin"]
+    )
+    result = await workflow.execute(page)
+    
+    assert page.evaluate.await_args.args[1] == [["fill", "#a", "1"], ["fill", "#b", "2"], ["fill", "#c", "3"]]
+    assert calls == [
+        ("#b", "fill", "2"),
+        ("#pin", "fill", "4"),
+        ("button[type='submit']", "click")
+    ]
+    assert result["fields_filled"] == 4
+    assert result["filled_fields"] is None
+    
+    # Only the main frame's navigation ends the post-submit wait
+    predicate = page.wait_for_event.await_args.kwargs["predicate"]
+    assert predicate(page.main_frame) and not predicate(MagicMock())
+    
+    # Running again on the same page reuses the locators
+    await workflow.execute(page)
+    assert page.locator.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_form_workflow_only_ignores_submit_timeouts():
+    """Test a submit that neither navigates nor settles is fine but other errors surface"""
+    from playwright.async_api import Error, TimeoutError as PWTimeout
+    
+    page = MagicMock()
+    page.goto = AsyncMock()
+    mock_locators(page)
+    page.evaluate = AsyncMock(return_value=[])
+    page.wait_for_event = AsyncMock(side_effect=PWTimeout("no navigation"))
+    page.wait_for_load_state = AsyncMock(side_effect=PWTimeout("not idle"))
+    
+    workflow = FormWorkflow("https://example.com", {"#a": "1"})
+    assert (await workflow.execute(page))["submitted"] is True
+    
+    page.wait_for_event = AsyncMock(side_effect=Error("Target page has been closed"))
+    with pytest.raises(Error):
+        await workflow.execute(page)
+
+
+@pytest.mark.asyncio
+async def test_batch_fill_leaves_hidden_fields_and_rejected_values_to_playwright():
+    """Test hidden fields and values an input would sanitise are not filled in-page"""
+    from playwright.async_api import async_playwright
+    from purple_guardian.workflows import _BATCH_OPS_JS
+    
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+        try:
+            page = await browser.new_page()
+            await page.set_content(
+                '<input id="text"><input id="hidden" type="hidden">'
+                '<input id="gone" style="display:none"><input id="num" type="number">'
+            )
+            pending = await page.evaluate(_BATCH_OPS_JS, [
+                ["fill", "#text", "x"],
+                ["fill", "#hidden", "h"],
+                ["fill", "#gone", "g"],
+                ["fill", "#num", "not a number"]
+            ])
+            
+            assert pending == [1, 2, 3]
+            assert await page.input_value("#text") == "x"
+        finally:
+            await browser.close()
+
+
+@pytest.mark.asyncio
+async def test_basic_workflow_fuses_fill_and_click_runs():
+    """Test fills and the click ending them share one evaluate"""
+    page = MagicMock()
+    page.goto = AsyncMock()
+    calls = mock_locators(page)
+    page.wait_for_selector = AsyncMock()
+    page.evaluate = AsyncMock(side_effect=[[], [1]])  # "#next" is hidden
+    
+    workflow = BasicWorkflow("https://example.com", [
+        {"type": "fill", "selector": "#user", "value": "u"},
+        {"type": "fill", "selector": "#pass", "value": "p"},
+        {"type": "click", "selector": "#login"},
+        {"type": "wait", "selector": "#home"},
+        {"type": "fill", "selector": "#search", "value": "q"},
+        {"type": "click", "selector": "#next"},
+        {"type": "click", "selector": "#last"}
+    ], verbose=True)
+    result = await workflow.execute(page)
+    
+    assert [call.args[1] for call in page.evaluate.await_args_list] == [
+        [["fill", "#user", "u"], ["fill", "#pass", "p"], ["click", "#login", None]],
+        [["fill", "#search", "q"], ["click", "#next", None]]
+    ]
+    assert calls == [("#next", "click"), ("#last", "click")]
+    assert result["results"] == [
+        "Filled: #user = u", "Filled: #pass = p", "Clicked: #login", "Waited for: #home",
+        "Filled: #search = q", "Clicked: #next", "Clicked: #last"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_basic_workflow_screenshots_do_not_block():
+    """Test screenshots are written while later actions run and awaited at the end"""
+    written = []
+    release = asyncio.Event()
+    
+    async def screenshot(path):
+        await release.wait()
+        written.append(path)
+    
+    async def click():
+        assert written == []  # the screenshot is still being written
+        release.set()
+    
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.screenshot = AsyncMock(side_effect=screenshot)
+    page.locator.return_value.first.click = AsyncMock(side_effect=click)
+    
+    workflow = BasicWorkflow("https://example.com", [
+        {"type": "screenshot", "path": "a.png", "async": True},
+        {"type": "click", "selector": "#next"}
+    ])
+    await workflow.execute(page)
+    
+    assert written == ["a.png"]
+    assert workflow._pending_io == []
+    
+    # By default screenshots finish before the next action
+    page.screenshot = AsyncMock()
+    workflow.actions = [{"type": "screenshot", "path": "b.png"}]
+    await workflow.execute(page)
+    page.screenshot.assert_awaited_once_with(path="b.png")
+
+
+@pytest.mark.asyncio
+async def test_basic_workflow_runs_groups_concurrently():
+    """Test actions sharing a group run together and conflicting groups are rejected"""
+    running = []
+    peak = []
+    
+    async def wait_for_selector(selector):
+        running.append(selector)
+        peak.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(selector)
+    
+    page = MagicMock()
+    page.goto = AsyncMock()
+    mock_locators(page)
+    page.wait_for_selector = AsyncMock(side_effect=wait_for_selector)
+    
+    workflow = BasicWorkflow("https://example.com", [
+        {"type": "wait", "selector": "#a", "group": 1},
+        {"type": "wait", "selector": "#b", "group": 1},
+        {"type": "click", "selector": "#c"}
+    ], verbose=True)
+    result = await workflow.execute(page)
+    
+    assert max(peak) == 2
+    assert result["results"] == ["Waited for: #a", "Waited for: #b", "Clicked: #c"]
+    
+    with pytest.raises(ValueError):
+        BasicWorkflow("https://example.com", [
+            {"type": "click", "selector": "#a", "group": 1},
+            {"type": "fill", "selector": "#a", "value": "x", "group": 1}
+        ])
+    
+    with pytest.raises(ValueError):
+        BasicWorkflow("https://example.com", [{"type": "hover", "selector": "#a"}])
+    
+    # Actions appended in place are picked up
+    page.wait_for_selector.reset_mock()
+    workflow.actions.append({"type": "wait", "selector": "#d"})
+    result = await workflow.execute(page)
+    assert result["actions_executed"] == 4
+    page.wait_for_selector.assert_any_await("#d")
+
+
+@pytest.mark.asyncio
+async def test_navigation_workflow_pools_url_steps():
+    """Test URL-only steps load concurrently on a bounded set of pooled pages"""
+    pooled_pages = []
+    
+    async def goto(url, wait_until):
+        await asyncio.sleep(0)
+    
+    async def new_page():
+        pooled = MagicMock()
+        pooled.goto = AsyncMock(side_effect=goto)
+        pooled.is_closed = MagicMock(return_value=False)
+        pooled.close = AsyncMock()
+        pooled_pages.append(pooled)
+        return pooled
+    
+    page = MagicMock()
+    page.url = "https://example.com/4"
+    page.goto = AsyncMock()
+    page.context.new_page = AsyncMock(side_effect=new_page)
+    
+    urls = [f"https://example.com/{i}" for i in range(5)]
+    result = await NavigationWorkflow(urls, pool_size=2).execute(page)
+    
+    page.goto.assert_awaited_once_with(urls[-1], wait_until="load")
+    assert len(pooled_pages) == 2
+    assert sorted(c.args[0] for p in pooled_pages for c in p.goto.await_args_list) == urls[:-1]
+    assert all(p.close.await_count == 1 for p in pooled_pages)
+    assert result["urls_visited"] == urls
+    assert result["final_url"] == urls[-1]
+
+
+@pytest.mark.asyncio
+async def test_navigation_workflow_waits_for_load_on_last_step():
+    """Test only the last navigation waits for the full load"""
+    page = MagicMock()
+    page.goto = AsyncMock()
+    
+    await NavigationWorkflow([
+        "https://example.com/1",
+        {"type": "goto", "url": "https://example.com/2", "wait_until": "commit"},
+        "https://example.com/3"
+    ]).execute(page)
+    
+    assert [call.kwargs["wait_until"] for call in page.goto.await_args_list] == [
+        "domcontentloaded", "commit", "load"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_navigation_workflow_prefetches_url_prefix():
+    """Test the leading URL steps are opened together on throwaway pages first"""
+    throwaway = []
+    
+    async def new_page():
+        prefetched = MagicMock()
+        prefetched.goto = AsyncMock()
+        prefetched.close = AsyncMock()
+        throwaway.append(prefetched)
+        return prefetched
+    
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.click = AsyncMock()
+    page.wait_for_load_state = AsyncMock()
+    page.context.new_page = AsyncMock(side_effect=new_page)
+    
+    await NavigationWorkflow([
+        "https://example.com/1",
+        "https://example.com/2",
+        {"type": "click_and_wait", "selector": "#next"},
+        "https://example.com/3"
+    ], prefetch=True).execute(page)
+    
+    assert [p.goto.await_args.args[0] for p in throwaway] == ["https://example.com/1", "https://example.com/2"]
+    assert all(p.goto.await_args.kwargs == {"wait_until": "commit"} for p in throwaway)
+    assert all(p.close.await_count == 1 for p in throwaway)
+    assert page.goto.await_count == 3
 
 
 def test_guardian_statistics():
@@ -148,8 +951,8 @@ def test_guardian_statistics():
     assert stats["successful_executions"] == 0
     
     # After execution (simulated)
-    guardian.stats["total_executions"] = 1
-    guardian.stats["successful_executions"] = 1
+    guardian._stats.total = 1
+    guardian._stats.ok = 1
     
     stats = guardian.get_stats()
     assert stats["total_executions"] == 1
@@ -0,0 +1,20 @@
+import pytest_asyncio
+from playwright.async_api import async_playwright
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """One Chromium instance shared by the whole test session"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser):
+    """A fresh page in its own context for each test"""
+    context = await browser.new_context()
+    page = await context.new_page()
+    yield page
+    await context.close()
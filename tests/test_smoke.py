@@ -1,12 +1,9 @@
-from playwright.sync_api import sync_playwright
+import pytest
 
+# Every test shares the session event loop the browser fixture lives on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
-def test_title_contains_google():
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto("https://www.google.com")
-        assert "Google" in page.title()
-        browser.close()
\ No newline at end of file
+async def test_title_contains_google(page):
+    await page.goto("https://www.google.com")
+    assert "Google" in await page.title()